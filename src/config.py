@@ -1,27 +1,30 @@
 """Configuration management."""
 
+import functools
 import os
+from dataclasses import dataclass
 from pathlib import Path
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Application configuration."""
+    """Application configuration, read from the environment once at import."""
 
     # Delay settings
-    MIN_DELAY: float = float(os.getenv("MIN_DELAY", "2"))
-    MAX_DELAY: float = float(os.getenv("MAX_DELAY", "5"))
-    SCROLL_PAUSE: float = float(os.getenv("SCROLL_PAUSE", "1"))
-    LONG_PAUSE_INTERVAL: int = int(os.getenv("LONG_PAUSE_INTERVAL", "50"))
-    LONG_PAUSE_DURATION: float = float(os.getenv("LONG_PAUSE_DURATION", "30"))
+    MIN_DELAY: float
+    MAX_DELAY: float
+    SCROLL_PAUSE: float
+    LONG_PAUSE_INTERVAL: int
+    LONG_PAUSE_DURATION: float
 
     # Safety limits
-    MAX_PROFILES_PER_SESSION: int = int(os.getenv("MAX_PROFILES_PER_SESSION", "500"))
+    MAX_PROFILES_PER_SESSION: int
 
     # Browser
-    CHROME_USER_DATA_DIR: str = os.getenv("CHROME_USER_DATA_DIR", "")
+    CHROME_USER_DATA_DIR: str
 
     # LinkedIn URLs
     LINKEDIN_BASE_URL: str = "https://www.linkedin.com"
@@ -30,11 +33,24 @@ class Config:
     # Output
     OUTPUT_DIR: Path = Path("output")
 
-    @classmethod
-    def get_output_dir(cls) -> Path:
-        """Get output directory, creating it if necessary."""
-        cls.OUTPUT_DIR.mkdir(exist_ok=True)
-        return cls.OUTPUT_DIR
+    @functools.cache
+    def get_output_dir(self) -> Path:
+        """Get output directory, creating it on first use."""
+        self.OUTPUT_DIR.mkdir(exist_ok=True)
+        return self.OUTPUT_DIR
 
 
-config = Config()
+def _load() -> Config:
+    """Build the configuration from environment variables."""
+    return Config(
+        MIN_DELAY=float(os.getenv("MIN_DELAY", "2")),
+        MAX_DELAY=float(os.getenv("MAX_DELAY", "5")),
+        SCROLL_PAUSE=float(os.getenv("SCROLL_PAUSE", "1")),
+        LONG_PAUSE_INTERVAL=int(os.getenv("LONG_PAUSE_INTERVAL", "50")),
+        LONG_PAUSE_DURATION=float(os.getenv("LONG_PAUSE_DURATION", "30")),
+        MAX_PROFILES_PER_SESSION=int(os.getenv("MAX_PROFILES_PER_SESSION", "500")),
+        CHROME_USER_DATA_DIR=os.getenv("CHROME_USER_DATA_DIR", ""),
+    )
+
+
+config = _load()
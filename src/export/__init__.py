@@ -1,5 +1,5 @@
 """Export modules."""
 
-from .csv_export import CSVExporter
+from .csv_export import CSVExporter, CSVAppender
 
-__all__ = ["CSVExporter"]
+__all__ = ["CSVExporter", "CSVAppender"]
@@ -1,7 +1,9 @@
 """CSV export functionality."""
 
-import csv
+import gzip
+import os
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import List
 
@@ -11,6 +13,26 @@ from ..utils.logger import get_logger
 
 logger = get_logger()
 
+# Free-text fields, in CSVExporter.HEADERS order; always written quoted
+_text_fields = attrgetter(
+    "first_name",
+    "last_name",
+    "full_name",
+    "headline",
+    "current_company",
+    "location",
+    "profile_url",
+)
+
+# Inside a quoted field only the quote character itself needs escaping
+_QUOTE_TRANS = str.maketrans({'"': '""'})
+
+
+def _format_row(profile: ProfileData) -> str:
+    """Format a profile as one CSV line without going through the csv module."""
+    text = '","'.join([field.translate(_QUOTE_TRANS) for field in _text_fields(profile)])
+    return f'"{text}",{profile.is_open_to_work},{profile.scraped_at.isoformat()}\r\n'
+
 
 class CSVExporter:
     """Export profile data to CSV files."""
@@ -27,23 +49,26 @@ class CSVExporter:
         "scraped_at",
     ]
 
+    # Write buffer size; coalesces many small row writes into fewer syscalls
+    BUFFER_SIZE = 1024 * 1024
+
     @classmethod
-    def export(
+    def build_filepath(
         cls,
-        profiles: List[ProfileData],
         filename: str = None,
         output_dir: Path = None,
+        compress: bool = False,
     ) -> Path:
         """
-        Export profiles to CSV file.
+        Resolve the output path for an export.
 
         Args:
-            profiles: List of ProfileData objects
             filename: Output filename (auto-generated if not provided)
             output_dir: Output directory (default: config.OUTPUT_DIR)
+            compress: Add a .gz suffix for gzip-compressed output
 
         Returns:
-            Path to the created CSV file
+            Path to the CSV file
         """
         output_dir = output_dir or config.get_output_dir()
 
@@ -51,14 +76,54 @@ class CSVExporter:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"linkedin_opentowork_{timestamp}.csv"
 
-        filepath = output_dir / filename
+        if compress and not filename.endswith(".gz"):
+            filename += ".gz"
 
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=cls.HEADERS)
-            writer.writeheader()
+        return output_dir / filename
+
+    @classmethod
+    def open_file(cls, filepath: Path, mode: str, compress: bool = False):
+        """
+        Open a CSV file for writing.
 
-            for profile in profiles:
-                writer.writerow(profile.to_dict())
+        Args:
+            filepath: Path to the CSV file
+            mode: "w" to overwrite or "a" to append
+            compress: Write gzip-compressed output (fast compression level)
+
+        Returns:
+            Text file object
+        """
+        if compress:
+            return gzip.open(filepath, mode + "t", compresslevel=1, newline="", encoding="utf-8")
+
+        return open(filepath, mode, buffering=cls.BUFFER_SIZE, newline="", encoding="utf-8")
+
+    @classmethod
+    def export(
+        cls,
+        profiles: List[ProfileData],
+        filename: str = None,
+        output_dir: Path = None,
+        compress: bool = False,
+    ) -> Path:
+        """
+        Export profiles to CSV file.
+
+        Args:
+            profiles: List of ProfileData objects
+            filename: Output filename (auto-generated if not provided)
+            output_dir: Output directory (default: config.OUTPUT_DIR)
+            compress: Write a gzip-compressed .csv.gz file
+
+        Returns:
+            Path to the created CSV file
+        """
+        filepath = cls.build_filepath(filename, output_dir, compress)
+
+        with cls.open_file(filepath, "w", compress) as f:
+            f.write(_HEADER)
+            f.writelines(map(_format_row, profiles))
 
         logger.info(f"Exported {len(profiles)} profiles to {filepath}")
         return filepath
@@ -68,16 +133,92 @@ class CSVExporter:
         """
         Append a single profile to an existing CSV file.
 
+        Reopens the file on every call; prefer append_many() for batches.
+
         Args:
             profile: ProfileData object
             filepath: Path to existing CSV file
         """
-        file_exists = filepath.exists()
+        cls.append_many([profile], filepath)
+
+    @classmethod
+    def append_many(cls, profiles: List[ProfileData], filepath: Path) -> None:
+        """
+        Append several profiles to a CSV file in one write.
+
+        Args:
+            profiles: List of ProfileData objects
+            filepath: Path to CSV file (created with a header if missing)
+        """
+        data = memoryview("".join(map(_format_row, profiles)).encode("utf-8"))
 
-        with open(filepath, "a", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=cls.HEADERS)
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o666)
+        try:
+            if os.fstat(fd).st_size == 0:
+                os.write(fd, _HEADER_LINE)
 
-            if not file_exists:
-                writer.writeheader()
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+
+_HEADER = ",".join(CSVExporter.HEADERS) + "\r\n"
+
+# Header line pre-encoded for the raw append path
+_HEADER_LINE = _HEADER.encode("utf-8")
+
+
+class CSVAppender:
+    """Append profiles to a CSV file kept open for the whole session."""
+
+    def __init__(self, filepath: Path, flush_every: int = 256, compress: bool = False):
+        """
+        Initialize the appender.
+
+        Args:
+            filepath: Path to the CSV file (created if missing)
+            flush_every: Flush to disk after this many rows
+            compress: Write gzip-compressed output
+        """
+        self.filepath = filepath
+        self.flush_every = flush_every
+        self.compress = compress
+        self.count = 0
+        self._file = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def open(self) -> None:
+        """Open the file and write the header if it is empty."""
+        self._file = CSVExporter.open_file(self.filepath, "a", self.compress)
+
+        if os.fstat(self._file.fileno()).st_size == 0:
+            self._file.write(_HEADER)
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        if self._file:
+            self._file.close()
+            self._file = None
+            logger.info(f"Appended {self.count} profiles to {self.filepath}")
+
+    def append(self, profile: ProfileData) -> None:
+        """
+        Append a single profile.
+
+        Args:
+            profile: ProfileData object
+        """
+        self._file.write(_format_row(profile))
+        self.count += 1
 
-            writer.writerow(profile.to_dict())
+        if self.count % self.flush_every == 0:
+            self._file.flush()
@@ -2,6 +2,7 @@
 
 import sys
 import io
+from collections import deque
 from typing import Optional
 
 # Fix Windows console encoding for Unicode characters
@@ -10,6 +11,7 @@ if sys.platform == "win32":
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
 import click
+from rich import box
 from rich.console import Console
 from rich.prompt import Prompt, IntPrompt, Confirm
 from rich.panel import Panel
@@ -18,7 +20,7 @@ from rich.table import Table
 from .config import config
 from .scraper import LinkedInScraper
 from .scraper.profile_parser import ProfileData
-from .export import CSVExporter
+from .export import CSVExporter, CSVAppender
 from .utils.logger import setup_logger, get_logger
 
 console = Console(force_terminal=True)
@@ -33,41 +35,68 @@ Search profiles and filter by Open to Work status
     console.print(Panel(banner.strip(), border_style="blue"))
 
 
-def print_results_table(profiles: list[ProfileData]):
-    """Print results in a table format."""
-    table = Table(title="Scraped Profiles")
+def print_results_table(profiles: list[ProfileData], total: int):
+    """Print the given profiles in a table format, noting how many were left out."""
+    table = Table(
+        title="Scraped Profiles",
+        box=box.SIMPLE,
+        show_edge=False,
+        expand=False,
+        padding=(0, 1),
+    )
 
     table.add_column("Name", style="cyan")
     table.add_column("Headline", style="white", max_width=40)
     table.add_column("Location", style="green")
     table.add_column("Open to Work", style="yellow")
 
-    for profile in profiles[:20]:
+    for profile in profiles:
+        headline = profile.headline
+        if len(headline) > 40:
+            headline = headline[:37] + "..."
+
         table.add_row(
             profile.full_name,
-            profile.headline[:40] + "..." if len(profile.headline) > 40 else profile.headline,
+            headline,
             profile.location,
             "Yes" if profile.is_open_to_work else "No",
         )
 
-    if len(profiles) > 20:
-        table.add_row("...", f"({len(profiles) - 20} more)", "...", "...")
-
     console.print(table)
 
+    if total > len(profiles):
+        console.print(f"... ({total - len(profiles)} more)")
+
 
 @click.command()
-@click.option("--job", "-j", help="Job title to search for")
+@click.option("--job", "-j", "jobs", multiple=True, help="Job title to search for (repeatable)")
 @click.option("--location", "-l", help="Location to filter by")
 @click.option("--max", "-m", "max_profiles", type=int, help="Maximum profiles to collect")
 @click.option("--headless", is_flag=True, help="Run in headless mode (not recommended)")
 @click.option("--open-to-work-only", is_flag=True, help="Only include profiles with Open to Work indicator")
+@click.option("--gzip", "compress", is_flag=True, help="Write gzip-compressed CSV (.csv.gz)")
+@click.option("--resume", is_flag=True, help="Skip profiles already exported by earlier runs")
+@click.option(
+    "--concurrency",
+    type=click.IntRange(1, 5),
+    default=1,
+    help="Job title searches to run in parallel, each in its own browser",
+)
+@click.option(
+    "--block-assets/--no-block-assets",
+    default=False,
+    help="Skip loading images, fonts, media and trackers in the browser (disables its HTTP cache)",
+)
 def main(
-    job: Optional[str],
+    jobs: tuple[str, ...],
     location: Optional[str],
     max_profiles: Optional[int],
     headless: bool,
     open_to_work_only: bool,
+    compress: bool,
+    resume: bool,
+    concurrency: int,
+    block_assets: bool,
 ):
     """
     LinkedIn Open to Work Scraper
@@ -78,10 +107,14 @@ def main(
     setup_logger()
     logger = get_logger()
 
+    # Resolve the output file once; the timestamp marks the start of this run
+    filepath = CSVExporter.build_filepath(compress=compress)
+    seen_path = config.get_output_dir() / "seen.sqlite3" if resume else None
+
     print_banner()
 
-    if not job:
-        job = Prompt.ask("[cyan]Job title to search for[/cyan]")
+    if not jobs:
+        jobs = (Prompt.ask("[cyan]Job title to search for[/cyan]"),)
 
     if not location:
         location = Prompt.ask("[cyan]Location[/cyan]", default="")
@@ -95,7 +128,7 @@ def main(
     max_profiles = min(max_profiles, config.MAX_PROFILES_PER_SESSION)
 
     console.print()
-    console.print(f"[bold]Search:[/bold] {job}")
+    console.print(f"[bold]Search:[/bold] {', '.join(jobs)}")
     console.print(f"[bold]Location:[/bold] {location or 'Any'}")
     console.print(f"[bold]Max profiles:[/bold] {max_profiles}")
     console.print(f"[bold]Filter:[/bold] {'Open to Work only' if open_to_work_only else 'All profiles'}")
@@ -105,17 +138,23 @@ def main(
         console.print("[yellow]Cancelled[/yellow]")
         return
 
-    profiles = []
+    recent: deque[ProfileData] = deque(maxlen=20)
+    count = 0
 
     try:
-        with LinkedInScraper(headless=headless) as scraper:
-            for profile in scraper.scrape_search_results(
-                job_title=job,
+        with LinkedInScraper(
+            headless=headless, seen_path=seen_path, block_assets=block_assets
+        ) as scraper, CSVAppender(filepath, compress=compress) as appender:
+            for profile in scraper.scrape_many(
+                job_titles=list(jobs),
                 location=location,
                 max_profiles=max_profiles,
                 open_to_work_only=open_to_work_only,
+                concurrency=concurrency,
             ):
-                profiles.append(profile)
+                appender.append(profile)
+                recent.append(profile)
+                count += 1
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Scraping interrupted by user[/yellow]")
@@ -124,24 +163,19 @@ def main(
         logger.error(f"Scraping error: {e}")
         console.print(f"[red]Error: {e}[/red]")
 
-    if not profiles:
+    if not count:
+        filepath.unlink(missing_ok=True)
         console.print("[yellow]No profiles found[/yellow]")
         return
 
     console.print()
-    print_results_table(profiles)
+    print_results_table(list(recent), count)
     console.print()
 
-    try:
-        filepath = CSVExporter.export(profiles)
-        console.print(f"[green]Exported to: {filepath}[/green]")
-
-    except Exception as e:
-        logger.error(f"Export error: {e}")
-        console.print(f"[red]Export error: {e}[/red]")
+    console.print(f"[green]Exported to: {filepath}[/green]")
 
     console.print()
-    console.print(f"[bold green]Done! Collected {len(profiles)} profiles.[/bold green]")
+    console.print(f"[bold green]Done! Collected {count} profiles.[/bold green]")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,18 @@
 """Scraper modules."""
 
-from .linkedin import LinkedInScraper
 from .profile_parser import ProfileParser
-from .opentowork import OpenToWorkDetector
 
 __all__ = ["LinkedInScraper", "ProfileParser", "OpenToWorkDetector"]
+
+
+def __getattr__(name: str):
+    """Import the browser and image-analysis modules only when first used."""
+    if name == "LinkedInScraper":
+        from .linkedin import LinkedInScraper
+        return LinkedInScraper
+
+    if name == "OpenToWorkDetector":
+        from .opentowork import OpenToWorkDetector
+        return OpenToWorkDetector
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
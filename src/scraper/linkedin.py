@@ -1,37 +1,238 @@
 """Main LinkedIn scraper class."""
 
-import random
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Generator, Optional
-from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
-from rich.progress import Progress, TextColumn, BarColumn, TaskProgressColumn
+from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext, Locator, Route
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from rich.progress import Progress, TaskID, TextColumn, BarColumn, TaskProgressColumn
 
 from ..config import config
 from ..utils.logger import get_logger
-from ..utils.delays import human_delay, long_pause, scroll_pause
+from ..utils.delays import human_delay, long_pause, next_delay, sleep_until
 from ..utils.browser import get_chrome_user_data_dir
 from .profile_parser import ProfileParser, ProfileData
 from .opentowork import OpenToWorkDetector
 from .search import build_search_url_simple
+from .seen import SeenStore, url_hash
 
 logger = get_logger()
 
+# Index of the first selector matching an element (visible and enabled if
+# requested), or -1. Selectors the browser cannot parse are skipped.
+FIRST_MATCH_JS = """
+([selectors, visibleOnly]) => {
+    for (let i = 0; i < selectors.length; i++) {
+        let el;
+        try {
+            el = document.querySelector(selectors[i]);
+        } catch (e) {
+            continue;
+        }
+        if (!el) continue;
+        if (!visibleOnly) return i;
+
+        const rect = el.getBoundingClientRect();
+        const style = window.getComputedStyle(el);
+        if (rect.width > 0 && rect.height > 0 && style.visibility !== "hidden" && !el.disabled) {
+            return i;
+        }
+    }
+    return -1;
+}
+"""
+
+# Scroll in random steps, pausing so lazy-loaded results can render, until the
+# page has sat at the bottom without growing for two consecutive pauses (late
+# responses get a second chance). Returns the steps taken.
+SCROLL_TO_LOAD_JS = """
+async ([maxSteps, minPause, maxPause]) => {
+    let steps = 0;
+    let stableChecks = 0;
+    let lastHeight = document.body.scrollHeight;
+    while (steps < maxSteps) {
+        window.scrollBy(0, 300 + Math.floor(Math.random() * 300));
+        steps++;
+        await new Promise((resolve) => setTimeout(resolve, minPause + Math.random() * (maxPause - minPause)));
+
+        const height = document.body.scrollHeight;
+        const atBottom = window.scrollY + window.innerHeight >= height - 2;
+        stableChecks = atBottom && height === lastHeight ? stableChecks + 1 : 0;
+        if (stableChecks >= 2) break;
+        lastHeight = height;
+    }
+    return steps;
+}
+"""
+
+CARD_HTML_JS = "(selector) => Array.from(document.querySelectorAll(selector), (el) => el.outerHTML)"
+
+FIRST_CARD_HTML_JS = "(selector) => document.querySelector(selector)?.outerHTML ?? null"
+
+# True once the first card differs from the given outer HTML, i.e. the next
+# page of results has replaced the previous one
+CARDS_CHANGED_JS = """
+([selector, previousHtml]) => {
+    const el = document.querySelector(selector);
+    return el !== null && el.outerHTML !== previousHtml;
+}
+"""
+
+# Like CARD_HTML_JS, but null for cards showing none of the cheap Open to Work
+# signals (text, badge selectors) and no profile photo for the green-frame
+# check, so those cards are never serialized back to Python.
+OPEN_TO_WORK_CARD_HTML_JS = """
+([selector, indicators, badgeSelectors]) => Array.from(document.querySelectorAll(selector), (el) => {
+    const html = el.outerHTML;
+    const lower = html.toLowerCase();
+    if (indicators.some((indicator) => lower.includes(indicator))) return html;
+
+    for (const badge of badgeSelectors) {
+        try {
+            if (el.querySelector(badge)) return html;
+        } catch (e) {
+            continue;
+        }
+    }
+
+    for (const img of el.querySelectorAll("img")) {
+        const src = img.getAttribute("src") || "";
+        if ((src.includes("profile") || src.includes("media.licdn")) && src.includes("100_100")) return html;
+    }
+    return null;
+})
+"""
+
 
 class LinkedInScraper:
     """Scrape LinkedIn profiles with Open to Work detection."""
 
-    def __init__(self, headless: bool = False):
+    LOGGED_IN_SELECTORS = [
+        "nav.global-nav",
+        "[data-control-name='nav.settings']",
+        ".feed-identity-module",
+        ".global-nav__me",
+    ]
+
+    # URL parts of the login, 2FA and auth wall pages
+    LOGIN_FLOW_PATHS = ("/login", "/checkpoint", "/uas/", "/authwall")
+
+    # Multiple selectors for different languages and LinkedIn versions
+    NEXT_PAGE_SELECTORS = [
+        "button[aria-label='Next']",
+        "button[aria-label='Suivant']",  # French
+        "button[aria-label='Weiter']",   # German
+        "a[aria-label='Next']",
+        "a[aria-label='Suivant']",
+        "button.artdeco-pagination__button--next",
+        "button[class*='pagination__button--next']",
+        "li.artdeco-pagination__indicator--number:last-child button",
+    ]
+
+    # Text-matching selectors are Playwright-only, so these lists are probed as
+    # one comma-joined locator instead of through FIRST_MATCH_JS
+    LOCATION_FILTER_SELECTORS = [
+        "button:has-text('Locations')",
+        "button:has-text('Lieux')",  # French
+        "button:has-text('Standorte')",  # German
+    ]
+
+    # Looser matches, only tried when no labelled "Locations" pill is visible
+    LOCATION_FILTER_FALLBACK_SELECTORS = [
+        "button[aria-label*='location']",
+        "button[aria-label*='Location']",
+        "#searchFilter_geoUrn",
+    ]
+
+    APPLY_FILTER_SELECTORS = [
+        "button:has-text('Show results')",
+        "button:has-text('Afficher les résultats')",
+        "button[data-test-reusables-filter-apply-button]",
+        "button.search-reusables__filter-apply-button",
+    ]
+
+    LOCATION_INPUT_SELECTORS = [
+        "input[placeholder*='location']",
+        "input[placeholder*='Location']",
+        "input[placeholder*='lieu']",
+        "input[aria-label*='location']",
+        "input[role='combobox']",
+    ]
+
+    LOCATION_SUGGESTION_SELECTORS = [
+        "[role='option']",
+        ".basic-typeahead__selectable",
+        "li[id*='typeahead']",
+    ]
+
+    # Profiles collected between progress bar updates
+    PROGRESS_EVERY = 5
+
+    # Actions one results-page scroll counts for, however many steps it took
+    SCROLL_ACTIONS = 3
+
+    # Chrome flags shared by both launch paths. QUIC lets LinkedIn's CDN reuse
+    # HTTP/3 connections across navigations; background networking (update
+    # checks, telemetry) only competes with the scrape.
+    BROWSER_ARGS = [
+        "--disable-blink-features=AutomationControlled",
+        "--disable-infobars",
+        "--enable-quic",
+        "--disable-background-networking",
+    ]
+
+    # Requests the scraper never reads. Stylesheets are kept: visibility
+    # checks and the filter dropdowns depend on layout.
+    BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+    BLOCKED_URL_PARTS = (
+        "px.ads.linkedin.com",
+        "/li/track",
+        "bat.bing.com",
+        "doubleclick.net",
+    )
+
+    def __init__(
+        self,
+        headless: bool = False,
+        seen_path: Optional[Path] = None,
+        block_assets: bool = False,
+        storage_state: Optional[dict] = None,
+        seen: Optional[SeenStore] = None,
+    ):
         """
         Initialize the scraper.
 
         Args:
             headless: Run browser in headless mode (not recommended)
+            seen_path: SQLite file of profiles exported by earlier runs, which
+                are skipped. Disabled when None.
+            block_assets: Abort image, font, media and tracker requests.
+                Routing disables the browser's HTTP cache, so this is off
+                by default.
+            storage_state: Logged-in cookies and storage to start a fresh
+                browser with, instead of the Chrome profile
+            seen: Open store shared with another scraper, used instead of
+                seen_path. It is left open by close().
         """
         self.headless = headless
+        self.block_assets = block_assets
+        self.storage_state = storage_state
         self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self.action_count = 0
+        self._logged_in = storage_state is not None
+        self._card_selector: Optional[str] = None
+        # Profiles handled this session, shared by every search it runs
+        self._seen_hashes: set[int] = set()
+        self._owns_seen = seen is None
+        if seen is None and seen_path:
+            seen = SeenStore(seen_path)
+        self.seen: Optional[SeenStore] = seen
 
     def __enter__(self):
         """Context manager entry."""
@@ -44,53 +245,88 @@ class LinkedInScraper:
 
     def start(self) -> None:
         """Start the browser."""
+        if self.seen is not None and self._owns_seen:
+            self.seen.open()
+
         logger.info("Starting browser...")
 
         self.playwright = sync_playwright().start()
 
-        user_data_dir = get_chrome_user_data_dir()
-        logger.info(f"Using Chrome profile: {user_data_dir}")
+        if self.storage_state is not None:
+            self._launch_browser(self.storage_state)
+        else:
+            user_data_dir = get_chrome_user_data_dir()
+            logger.info(f"Using Chrome profile: {user_data_dir}")
 
-        try:
-            self.context = self.playwright.chromium.launch_persistent_context(
-                user_data_dir,
-                headless=self.headless,
-                channel="chrome",
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-infobars",
-                    "--start-maximized",
-                ],
-                viewport={"width": 1920, "height": 1080},
-                ignore_default_args=["--enable-automation"],
-            )
+            try:
+                self.context = self.playwright.chromium.launch_persistent_context(
+                    user_data_dir,
+                    headless=self.headless,
+                    channel="chrome",
+                    args=[*self.BROWSER_ARGS, "--start-maximized"],
+                    viewport={"width": 1920, "height": 1080},
+                    ignore_default_args=["--enable-automation"],
+                )
+
+                if self.context.pages:
+                    self.page = self.context.pages[0]
+                else:
+                    self.page = self.context.new_page()
+
+                logger.info("Browser started successfully")
+
+            except Exception as e:
+                logger.error(f"Failed to start browser: {e}")
+                logger.info("Falling back to new browser instance...")
+                self._launch_browser()
+
+        # On the context so every page it opens is filtered. Routing turns off
+        # the browser's HTTP cache for every request, not just blocked ones.
+        if self.block_assets:
+            self.context.route("**/*", self._route_filter)
+
+    def _launch_browser(self, storage_state: Optional[dict] = None) -> None:
+        """
+        Launch a new browser instance with a fresh, non-persistent context.
 
-            if self.context.pages:
-                self.page = self.context.pages[0]
-            else:
-                self.page = self.context.new_page()
+        Args:
+            storage_state: Cookies and storage to load into the context
+        """
+        self.browser = self.playwright.chromium.launch(
+            headless=self.headless,
+            channel="chrome",
+            args=self.BROWSER_ARGS,
+        )
+        self.context = self.browser.new_context(
+            viewport={"width": 1920, "height": 1080},
+            storage_state=storage_state,
+        )
+        self.page = self.context.new_page()
+
+    def _route_filter(self, route: Route) -> None:
+        """
+        Abort images, fonts, media and tracking requests; let the rest through.
 
-            logger.info("Browser started successfully")
+        Every request goes through this callback, and with the sync API it
+        only runs while the calling thread is inside a Playwright call.
+        Requests made during a sleep wait for the next one.
 
-        except Exception as e:
-            logger.error(f"Failed to start browser: {e}")
-            logger.info("Falling back to new browser instance...")
+        Args:
+            route: Intercepted request
+        """
+        request = route.request
 
-            self.browser = self.playwright.chromium.launch(
-                headless=self.headless,
-                channel="chrome",
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-infobars",
-                ],
-            )
-            self.context = self.browser.new_context(
-                viewport={"width": 1920, "height": 1080}
-            )
-            self.page = self.context.new_page()
+        if request.resource_type in self.BLOCKED_RESOURCE_TYPES or any(
+            part in request.url for part in self.BLOCKED_URL_PARTS
+        ):
+            route.abort()
+        else:
+            route.continue_()
 
     def close(self) -> None:
         """Close the browser."""
+        if self.seen is not None and self._owns_seen:
+            self.seen.close()
         if self.context:
             self.context.close()
         if self.browser:
@@ -99,35 +335,80 @@ class LinkedInScraper:
             self.playwright.stop()
         logger.info("Browser closed")
 
-    def _increment_action(self) -> None:
+    def _increment_action(self, count: int = 1) -> None:
         """Increment action counter and take long pause if needed."""
-        self.action_count += 1
+        previous = self.action_count
+        self.action_count += count
 
-        if self.action_count % config.LONG_PAUSE_INTERVAL == 0:
+        # Pause whenever the count crosses a multiple of the interval
+        if self.action_count // config.LONG_PAUSE_INTERVAL > previous // config.LONG_PAUSE_INTERVAL:
             logger.info(f"Taking a break after {self.action_count} actions...")
             long_pause()
 
-    def is_logged_in(self) -> bool:
+    def _find_first(self, selectors: list[str], visible: bool = True) -> Optional[str]:
+        """
+        Find the first selector that matches an element on the current page.
+
+        All selectors are probed in one page.evaluate() call rather than
+        one count()/is_visible() round-trip per selector.
+
+        Args:
+            selectors: Plain CSS selectors to try, in order
+            visible: Only match visible, enabled elements
+
+        Returns:
+            The first matching selector, or None
+        """
+        try:
+            index = self.page.evaluate(FIRST_MATCH_JS, [selectors, visible])
+        except Exception as e:
+            logger.debug(f"Selector probe error: {e}")
+            return None
+
+        return selectors[index] if index >= 0 else None
+
+    def _visible_union(self, selectors: list[str]) -> Locator:
+        """
+        Build one locator for the first visible element matching any selector.
+
+        The selectors are joined into a single comma union, so Playwright
+        resolves them in one query instead of one probe per selector.
+        Matches come back in document order, not list order; probe
+        separate unions in turn where preference matters.
+
+        Args:
+            selectors: Playwright selectors, may use :has-text()
+
+        Returns:
+            Locator for the first visible match (is_visible() is False if none)
+        """
+        return self.page.locator(", ".join(f"{s}:visible" for s in selectors)).first
+
+    def is_logged_in(self, navigate: bool = True) -> bool:
         """
         Check if user is logged into LinkedIn.
 
+        A positive result is remembered for the session, so later searches
+        do not reload the home page to check again.
+
+        Args:
+            navigate: Load the home page first instead of probing the
+                current page
+
         Returns:
             True if logged in
         """
+        if self._logged_in:
+            return True
+
         try:
-            self.page.goto(config.LINKEDIN_BASE_URL, wait_until="domcontentloaded")
-            human_delay(2, 4)
-
-            logged_in_indicators = [
-                "nav.global-nav",
-                "[data-control-name='nav.settings']",
-                ".feed-identity-module",
-                ".global-nav__me",
-            ]
-
-            for selector in logged_in_indicators:
-                if self.page.locator(selector).count() > 0:
-                    return True
+            if navigate:
+                self.page.goto(config.LINKEDIN_BASE_URL, wait_until="domcontentloaded")
+                human_delay(2, 4)
+
+            if self._find_first(self.LOGGED_IN_SELECTORS, visible=False):
+                self._logged_in = True
+                return True
 
             if "/login" in self.page.url or "/checkpoint" in self.page.url:
                 return False
@@ -153,56 +434,199 @@ class LinkedInScraper:
 
         self.page.goto(f"{config.LINKEDIN_BASE_URL}/login", wait_until="domcontentloaded")
 
-        start_time = self.page.evaluate("() => Date.now()")
+        deadline = time.monotonic() + timeout
 
-        while True:
-            current_time = self.page.evaluate("() => Date.now()")
-            elapsed = (current_time - start_time) / 1000
+        # Sleep on navigation events until the browser leaves the login flow
+        try:
+            self.page.wait_for_url(self._left_login_flow, timeout=timeout * 1000)
+        except PlaywrightTimeoutError:
+            logger.error("Login timeout exceeded")
+            return False
+        except Exception as e:
+            logger.debug(f"Login navigation wait failed, polling instead: {e}")
 
-            if elapsed > timeout:
+        # Confirm with the session cookie, checked locally so polling never
+        # navigates away from the login form
+        while not self._has_session_cookie():
+            if time.monotonic() > deadline:
                 logger.error("Login timeout exceeded")
                 return False
 
-            if self.is_logged_in():
-                logger.info("Login successful!")
-                return True
+            time.sleep(0.5)
 
-            human_delay(2, 3)
+        logger.info("Login successful!")
+        self._logged_in = True
+        return True
 
-    def _scroll_page(self) -> bool:
+    def _left_login_flow(self, url: str) -> bool:
+        """Check whether a URL is a LinkedIn page outside login and verification."""
+        return url.startswith(config.LINKEDIN_BASE_URL) and not any(
+            part in url for part in self.LOGIN_FLOW_PATHS
+        )
+
+    def _has_session_cookie(self) -> bool:
         """
-        Scroll down the page to load more results.
+        Check for LinkedIn's session cookie in the browser context.
+
+        The li_at cookie is set as soon as login succeeds.
 
         Returns:
-            True if new content was loaded
+            True if a non-empty li_at cookie is present
         """
         try:
-            prev_height = self.page.evaluate("() => document.body.scrollHeight")
+            cookies = self.context.cookies(config.LINKEDIN_BASE_URL)
+        except Exception as e:
+            logger.debug(f"Cookie check error: {e}")
+            return False
 
-            scroll_amount = random.randint(300, 600)
-            self.page.evaluate(f"window.scrollBy(0, {scroll_amount})")
-            scroll_pause()
+        return any(c["name"] == "li_at" and c["value"] for c in cookies)
 
-            self._increment_action()
+    def _scroll_page(self, max_steps: int = 8) -> int:
+        """
+        Scroll down the page until lazy-loaded results stop appearing.
 
-            new_height = self.page.evaluate("() => document.body.scrollHeight")
+        The whole scroll-and-pause loop runs inside the browser in a single
+        call, with the pause jitter taken from SCROLL_PAUSE.
 
-            return new_height > prev_height
+        Args:
+            max_steps: Maximum number of scroll steps
+
+        Returns:
+            Number of scroll steps taken
+        """
+        pause_ms = config.SCROLL_PAUSE * 1000
 
+        try:
+            steps = self.page.evaluate(SCROLL_TO_LOAD_JS, [max_steps, pause_ms, pause_ms + 500])
         except Exception as e:
             logger.debug(f"Scroll error: {e}")
+            return 0
+
+        self._increment_action(self.SCROLL_ACTIONS)
+        return steps
+
+    def _get_profile_cards(self, open_to_work_only: bool = False) -> list[Optional[str]]:
+        """
+        Get the outer HTML of all profile cards on the current page.
+
+        All cards are serialized in one page.evaluate() call, so parsing
+        them needs no further browser round-trips.
+
+        Args:
+            open_to_work_only: Return None in place of cards that cannot be
+                Open to Work, filtered in the page
+
+        Returns:
+            List of card HTML strings, one entry per card
+        """
+        # The container selector that matched once keeps matching on later pages
+        if not self._card_selector:
+            self._card_selector = self._find_first(
+                ProfileParser.CARD_SELECTORS["container"], visible=False
+            )
+
+        if not self._card_selector:
+            return []
+
+        try:
+            if open_to_work_only:
+                return self.page.evaluate(
+                    OPEN_TO_WORK_CARD_HTML_JS,
+                    [
+                        self._card_selector,
+                        OpenToWorkDetector.OPEN_TO_WORK_INDICATORS + OpenToWorkDetector.PHOTO_FRAME_INDICATORS,
+                        OpenToWorkDetector.BADGE_SELECTORS,
+                    ],
+                )
+
+            return self.page.evaluate(CARD_HTML_JS, self._card_selector)
+        except Exception as e:
+            logger.debug(f"Card extraction error: {e}")
+            return []
+
+    def _wait_for_cards(self, timeout: int = 10000, previous_first: Optional[str] = None) -> bool:
+        """
+        Wait until profile cards are attached to the page.
+
+        Args:
+            timeout: Maximum milliseconds to wait
+            previous_first: Outer HTML of the first card before navigating;
+                if given, also wait until it has been replaced
+
+        Returns:
+            True if cards appeared within the timeout
+        """
+        selector = self._card_selector or ", ".join(ProfileParser.CARD_SELECTORS["container"])
+
+        try:
+            if previous_first is None:
+                self.page.wait_for_selector(selector, timeout=timeout, state="attached")
+            else:
+                self.page.wait_for_function(
+                    CARDS_CHANGED_JS, arg=[selector, previous_first], timeout=timeout
+                )
+            return True
+        except PlaywrightTimeoutError:
+            logger.debug("Timed out waiting for profile cards")
             return False
 
-    def _get_profile_cards(self):
-        """Get all profile cards on the current page."""
-        selectors = ProfileParser.CARD_SELECTORS["container"]
+    def _first_card_html(self) -> Optional[str]:
+        """Get the outer HTML of the first profile card, if any."""
+        if not self._card_selector:
+            return None
 
-        for selector in selectors:
-            cards = self.page.locator(selector)
-            if cards.count() > 0:
-                return cards
+        try:
+            return self.page.evaluate(FIRST_CARD_HTML_JS, self._card_selector)
+        except Exception as e:
+            logger.debug(f"Card extraction error: {e}")
+            return None
+
+    def _process_cards(self, cards: list[Optional[str]]) -> list[ProfileData]:
+        """
+        Parse card HTML and detect Open to Work status.
+
+        Touches no Playwright objects, so it can run in a worker thread
+        while the browser moves on to the next page. Profiles already in
+        the seen store are dropped before Open to Work detection, which
+        downloads the remaining cards' photos in parallel.
+
+        Args:
+            cards: Outer HTML of each profile card, None for filtered cards
+
+        Returns:
+            Parsed profiles, in card order
+        """
+        profiles = []
+        profile_cards = []
 
-        return self.page.locator("li.reusable-search__result-container")
+        for i, card_html in enumerate(cards):
+            if card_html is None:
+                continue
+
+            try:
+                profile = ProfileParser.parse_card_html(card_html)
+                if not profile:
+                    continue
+
+                # Cards without a profile link all hash alike, so they are
+                # never looked up in or written to the store
+                if (
+                    self.seen is not None
+                    and profile.profile_url
+                    and url_hash(profile.profile_url) in self.seen
+                ):
+                    continue
+
+                profiles.append(profile)
+                profile_cards.append(card_html)
+            except Exception as e:
+                logger.debug(f"Error processing card {i}: {e}")
+
+        # Detect for the whole page at once so photo downloads run in parallel
+        for profile, is_open in zip(profiles, OpenToWorkDetector.detect_many_from_html(profile_cards)):
+            profile.is_open_to_work = is_open
+
+        return profiles
 
     def _go_to_next_page(self) -> bool:
         """
@@ -212,35 +636,24 @@ class LinkedInScraper:
             True if navigation successful
         """
         try:
-            # Multiple selectors for different languages and LinkedIn versions
-            next_selectors = [
-                "button[aria-label='Next']",
-                "button[aria-label='Suivant']",  # French
-                "button[aria-label='Weiter']",   # German
-                "a[aria-label='Next']",
-                "a[aria-label='Suivant']",
-                "button.artdeco-pagination__button--next",
-                "button[class*='pagination__button--next']",
-                "li.artdeco-pagination__indicator--number:last-child button",
-            ]
-
-            for selector in next_selectors:
+            # Compared against after the click to tell when the new page rendered
+            first_card = self._first_card_html()
+
+            # Visible, enabled "Next" control found in a single probe
+            selector = self._find_first(self.NEXT_PAGE_SELECTORS)
+            if selector:
                 try:
-                    btn = self.page.locator(selector).first
-                    if btn.count() > 0 and btn.is_visible():
-                        # Check if button is enabled (not disabled)
-                        is_disabled = btn.get_attribute("disabled")
-                        if is_disabled:
-                            continue
-
-                        human_delay()
-                        btn.click()
-                        human_delay(2, 4)
-                        self._increment_action()
-                        logger.debug(f"Navigated to next page using: {selector}")
-                        return True
-                except Exception:
-                    continue
+                    human_delay()
+                    # The settle pause runs from the click, overlapping the render wait
+                    settled = time.monotonic() + next_delay(0.3, 0.8)
+                    self.page.locator(selector).first.click()
+                    self._wait_for_cards(previous_first=first_card)
+                    sleep_until(settled)
+                    self._increment_action()
+                    logger.debug(f"Navigated to next page using: {selector}")
+                    return True
+                except Exception as e:
+                    logger.debug(f"Next button click failed: {e}")
 
             # Try scrolling to bottom and looking for pagination
             self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
@@ -250,15 +663,17 @@ class LinkedInScraper:
             try:
                 # Find current page and click next number
                 current = self.page.locator("button[aria-current='true']").first
-                if current.count() > 0:
+                if current.is_visible():
                     current_text = current.inner_text()
                     if current_text.isdigit():
                         next_num = int(current_text) + 1
                         next_page_btn = self.page.locator(f"button:has-text('{next_num}')").first
-                        if next_page_btn.count() > 0:
+                        if next_page_btn.is_visible():
                             human_delay()
+                            settled = time.monotonic() + next_delay(0.3, 0.8)
                             next_page_btn.click()
-                            human_delay(2, 4)
+                            self._wait_for_cards(previous_first=first_card)
+                            sleep_until(settled)
                             self._increment_action()
                             return True
             except Exception:
@@ -281,93 +696,48 @@ class LinkedInScraper:
             True if filter was applied successfully
         """
         try:
-            # Check if location filter is already showing results for the location
-            # by looking at the current filters
-            current_url = self.page.url
-            if f"location={location}" in current_url.lower() or "geourn" in current_url.lower():
-                logger.debug("Location filter may already be applied via URL")
+            # A geoUrn parameter means LinkedIn already applied a location
+            # filter. The free-text location= parameter from
+            # build_search_url_simple is not one, so it does not count.
+            if "geourn" in self.page.url.lower():
+                logger.debug("Location filter already applied via URL, skipping UI filter")
+                return True
 
             # Click on "Locations" filter button
-            location_filter_selectors = [
-                "button:has-text('Locations')",
-                "button:has-text('Lieux')",  # French
-                "button:has-text('Standorte')",  # German
-                "button[aria-label*='location']",
-                "button[aria-label*='Location']",
-                "#searchFilter_geoUrn",
-            ]
-
-            filter_clicked = False
-            for selector in location_filter_selectors:
-                try:
-                    btn = self.page.locator(selector).first
-                    if btn.count() > 0 and btn.is_visible():
-                        btn.click()
-                        human_delay(1, 2)
-                        filter_clicked = True
-                        break
-                except Exception:
-                    continue
-
-            if not filter_clicked:
+            btn = self._visible_union(self.LOCATION_FILTER_SELECTORS)
+            if not btn.is_visible():
+                btn = self._visible_union(self.LOCATION_FILTER_FALLBACK_SELECTORS)
+            if not btn.is_visible():
                 logger.debug("Could not find location filter button")
                 return False
 
+            btn.click()
+            human_delay(1, 2)
+
             # Type in the location search box
-            location_input_selectors = [
-                "input[placeholder*='location']",
-                "input[placeholder*='Location']",
-                "input[placeholder*='lieu']",
-                "input[aria-label*='location']",
-                "input[role='combobox']",
-            ]
-
-            for selector in location_input_selectors:
+            input_selector = self._find_first(self.LOCATION_INPUT_SELECTORS)
+            if input_selector:
                 try:
-                    input_el = self.page.locator(selector).first
-                    if input_el.count() > 0 and input_el.is_visible():
-                        input_el.fill(location)
-                        human_delay(1, 2)
-
-                        # Click on first suggestion
-                        suggestion_selectors = [
-                            "[role='option']",
-                            ".basic-typeahead__selectable",
-                            "li[id*='typeahead']",
-                        ]
-
-                        for sug_sel in suggestion_selectors:
-                            try:
-                                suggestion = self.page.locator(sug_sel).first
-                                if suggestion.count() > 0:
-                                    suggestion.click()
-                                    human_delay(0.5, 1)
-                                    break
-                            except Exception:
-                                continue
+                    self.page.locator(input_selector).first.fill(location)
+                    human_delay(1, 2)
 
-                        break
-                except Exception:
-                    continue
+                    # Click on first suggestion
+                    suggestion_selector = self._find_first(
+                        self.LOCATION_SUGGESTION_SELECTORS, visible=False
+                    )
+                    if suggestion_selector:
+                        self.page.locator(suggestion_selector).first.click()
+                        human_delay(0.5, 1)
+                except Exception as e:
+                    logger.debug(f"Could not fill location input: {e}")
 
             # Click "Show results" button
-            apply_selectors = [
-                "button:has-text('Show results')",
-                "button:has-text('Afficher les résultats')",
-                "button[data-test-reusables-filter-apply-button]",
-                "button.search-reusables__filter-apply-button",
-            ]
-
-            for selector in apply_selectors:
-                try:
-                    apply_btn = self.page.locator(selector).first
-                    if apply_btn.count() > 0 and apply_btn.is_visible():
-                        apply_btn.click()
-                        human_delay(2, 3)
-                        logger.info(f"Applied location filter: {location}")
-                        return True
-                except Exception:
-                    continue
+            apply_btn = self._visible_union(self.APPLY_FILTER_SELECTORS)
+            if apply_btn.is_visible():
+                apply_btn.click()
+                human_delay(2, 3)
+                logger.info(f"Applied location filter: {location}")
+                return True
 
             # Try pressing Enter as fallback
             self.page.keyboard.press("Enter")
@@ -385,6 +755,8 @@ class LinkedInScraper:
         location: str,
         max_profiles: int = 100,
         open_to_work_only: bool = True,
+        show_progress: bool = True,
+        stop: Optional[threading.Event] = None,
     ) -> Generator[ProfileData, None, None]:
         """
         Scrape LinkedIn search results.
@@ -394,11 +766,15 @@ class LinkedInScraper:
             location: Location to filter by
             max_profiles: Maximum profiles to collect
             open_to_work_only: Only return Open to Work profiles
+            show_progress: Display a progress bar
+            stop: Set to end the search at the next page
 
         Yields:
             ProfileData objects for matching profiles
         """
-        if not self.is_logged_in():
+        # A page already on LinkedIn shows the nav bar without reloading
+        on_linkedin = self.page.url.startswith(config.LINKEDIN_BASE_URL)
+        if not self.is_logged_in(navigate=not on_linkedin):
             if not self.wait_for_login():
                 logger.error("Could not log in to LinkedIn")
                 return
@@ -406,8 +782,10 @@ class LinkedInScraper:
         search_url = build_search_url_simple(job_title, location)
         logger.info(f"Navigating to search: {job_title}" + (f" in {location}" if location else ""))
 
+        settled = time.monotonic() + next_delay(0.5, 1)
         self.page.goto(search_url, wait_until="domcontentloaded")
-        human_delay(3, 5)
+        self._wait_for_cards()
+        sleep_until(settled)
 
         # Apply location filter through UI if needed
         if location:
@@ -415,30 +793,38 @@ class LinkedInScraper:
 
         collected_count = 0
         total_scraped = 0
-        seen_urls = set()
         page_num = 1
+        search_loc = location.casefold() if location else ""
 
         with Progress(
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             TaskProgressColumn(),
-        ) as progress:
+            disable=not show_progress,
+        ) as progress, ThreadPoolExecutor(max_workers=1) as pool:
             task = progress.add_task(
                 f"[cyan]Scraping profiles (Open to Work: {collected_count})...",
                 total=max_profiles,
             )
 
             while collected_count < max_profiles:
-                if total_scraped >= config.MAX_PROFILES_PER_SESSION:
+                if stop is not None and stop.is_set():
+                    break
+
+                if len(self._seen_hashes) >= config.MAX_PROFILES_PER_SESSION:
                     logger.warning("Session limit reached")
                     break
 
-                for _ in range(3):
-                    self._scroll_page()
-                    human_delay(1, 2)
+                self._scroll_page()
 
-                cards = self._get_profile_cards()
-                card_count = cards.count()
+                cards = self._get_profile_cards(open_to_work_only)
+
+                if not cards and self._card_selector:
+                    # Layout may have changed, rediscover the container selector
+                    self._card_selector = None
+                    cards = self._get_profile_cards(open_to_work_only)
+
+                card_count = len(cards)
 
                 if card_count == 0:
                     logger.warning("No profile cards found on page")
@@ -446,45 +832,227 @@ class LinkedInScraper:
 
                 logger.info(f"Page {page_num}: Found {card_count} profile cards")
 
-                for i in range(card_count):
+                # Parse cards (and download avatars) in the background. If this
+                # page cannot fill the quota on its own, navigate meanwhile.
+                processed = pool.submit(self._process_cards, cards)
+                navigate_early = card_count < max_profiles - collected_count
+                has_next_page = navigate_early and self._go_to_next_page()
+
+                for profile in processed.result():
                     if collected_count >= max_profiles:
                         break
 
-                    try:
-                        card = cards.nth(i)
-                        is_open = OpenToWorkDetector.detect_from_card(card)
-                        profile = ProfileParser.parse_card(card, is_open_to_work=is_open)
-
-                        if profile and profile.profile_url not in seen_urls:
-                            seen_urls.add(profile.profile_url)
-                            total_scraped += 1
-
-                            # Check location filter
-                            location_match = True
-                            if location:
-                                profile_loc = profile.location.lower()
-                                search_loc = location.lower()
-                                # Match if location contains the search term or vice versa
-                                location_match = search_loc in profile_loc or profile_loc in search_loc
-
-                            if location_match and (not open_to_work_only or profile.is_open_to_work):
-                                collected_count += 1
-                                progress.update(
-                                    task,
-                                    advance=1,
-                                    description=f"[cyan]Scraping profiles (Open to Work: {collected_count})...",
-                                )
-                                yield profile
-
-                    except Exception as e:
-                        logger.debug(f"Error processing card {i}: {e}")
-                        continue
-
-                if not self._go_to_next_page():
+                    profile_key = url_hash(profile.profile_url)
+
+                    if profile_key not in self._seen_hashes:
+                        self._seen_hashes.add(profile_key)
+                        total_scraped += 1
+
+                        # Check location filter
+                        location_match = True
+                        if search_loc:
+                            profile_loc = profile.location.casefold()
+                            # Match if location contains the search term or vice versa
+                            location_match = search_loc in profile_loc or profile_loc in search_loc
+
+                        if location_match and (not open_to_work_only or profile.is_open_to_work):
+                            # Only exported profiles are skipped by later runs,
+                            # which may use other filters. A shared store is
+                            # recorded by its owner, which does the exporting.
+                            if self.seen is not None and self._owns_seen and profile.profile_url:
+                                self.seen.add(profile_key)
+
+                            collected_count += 1
+                            if collected_count % self.PROGRESS_EVERY == 0:
+                                self._update_progress(progress, task, collected_count)
+                            yield profile
+
+                if collected_count >= max_profiles:
+                    break
+
+                if not navigate_early:
+                    has_next_page = self._go_to_next_page()
+
+                if not has_next_page:
                     logger.info("No more pages available")
                     break
 
                 page_num += 1
-                human_delay(2, 4)
+
+            self._update_progress(progress, task, collected_count)
 
         logger.info(f"Scraping complete: {collected_count} Open to Work profiles from {total_scraped} total")
+
+    def _update_progress(self, progress: Progress, task: TaskID, collected_count: int) -> None:
+        """Set the progress bar to the number of profiles collected so far."""
+        progress.update(
+            task,
+            completed=collected_count,
+            description=f"[cyan]Scraping profiles (Open to Work: {collected_count})...",
+        )
+
+    def scrape_many(
+        self,
+        job_titles: list[str],
+        location: str,
+        max_profiles: int = 100,
+        open_to_work_only: bool = True,
+        concurrency: int = 1,
+    ) -> Generator[ProfileData, None, None]:
+        """
+        Scrape the search results of several job titles in one session.
+
+        The searches share the login and de-duplication set, so a profile
+        matching more than one title is only yielded once. With concurrency
+        above 1, titles are searched in parallel, each in its own browser
+        started from this session's cookies.
+
+        Args:
+            job_titles: Job titles to search for
+            location: Location to filter by
+            max_profiles: Maximum profiles to collect per job title
+            open_to_work_only: Only return Open to Work profiles
+            concurrency: Number of searches to run at once
+
+        Yields:
+            ProfileData objects for matching profiles
+        """
+        if concurrency > 1 and len(job_titles) > 1:
+            yield from self._scrape_concurrently(
+                job_titles, location, max_profiles, open_to_work_only, concurrency
+            )
+            return
+
+        for job_title in job_titles:
+            if len(self._seen_hashes) >= config.MAX_PROFILES_PER_SESSION:
+                logger.warning("Session limit reached")
+                break
+
+            yield from self.scrape_search_results(
+                job_title=job_title,
+                location=location,
+                max_profiles=max_profiles,
+                open_to_work_only=open_to_work_only,
+            )
+
+    def _scrape_concurrently(
+        self,
+        job_titles: list[str],
+        location: str,
+        max_profiles: int,
+        open_to_work_only: bool,
+        concurrency: int,
+    ) -> Generator[ProfileData, None, None]:
+        """
+        Run searches in worker threads and yield their profiles as they arrive.
+
+        Playwright's sync API is bound to the thread that started it, so each
+        worker drives its own Playwright instance and browser. Workers share
+        this session's seen store, so profiles from earlier runs do not count
+        toward their quota; profiles are de-duplicated and recorded here, on
+        the calling thread, once yielded.
+
+        Args:
+            job_titles: Job titles to search for
+            location: Location to filter by
+            max_profiles: Maximum profiles to collect per job title
+            open_to_work_only: Only return Open to Work profiles
+            concurrency: Number of searches to run at once
+
+        Yields:
+            ProfileData objects for matching profiles
+        """
+        on_linkedin = self.page.url.startswith(config.LINKEDIN_BASE_URL)
+        if not self.is_logged_in(navigate=not on_linkedin):
+            if not self.wait_for_login():
+                logger.error("Could not log in to LinkedIn")
+                return
+
+        storage_state = self.context.storage_state()
+        results: queue.Queue[Optional[ProfileData]] = queue.Queue()
+        stop = threading.Event()
+        running = len(job_titles)
+
+        logger.info(f"Searching {running} job titles, {concurrency} at a time")
+
+        # Not a with block: leaving one would wait for every queued search
+        pool = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            for job_title in job_titles:
+                pool.submit(
+                    self._run_worker,
+                    storage_state,
+                    results,
+                    stop,
+                    job_title=job_title,
+                    location=location,
+                    max_profiles=max_profiles,
+                    open_to_work_only=open_to_work_only,
+                )
+
+            while running:
+                profile = results.get()
+                if profile is None:
+                    running -= 1
+                    continue
+
+                if len(self._seen_hashes) >= config.MAX_PROFILES_PER_SESSION:
+                    logger.warning("Session limit reached")
+                    break
+
+                # Workers already dropped profiles from earlier runs
+                profile_key = url_hash(profile.profile_url)
+                if profile_key in self._seen_hashes:
+                    continue
+
+                self._seen_hashes.add(profile_key)
+                if self.seen is not None and profile.profile_url:
+                    self.seen.add(profile_key)
+
+                yield profile
+        finally:
+            # When the caller stops early, drop the searches not started yet.
+            # Playwright objects cannot be closed from another thread, so the
+            # running ones end at their next page and the process waits for
+            # them on exit.
+            if running:
+                logger.info("Stopping searches; running ones finish their current page first")
+            stop.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _run_worker(
+        self,
+        storage_state: dict,
+        results: queue.Queue,
+        stop: threading.Event,
+        **search,
+    ) -> None:
+        """
+        Run one search in a separate browser, putting its profiles on a queue.
+
+        Args:
+            storage_state: Logged-in state exported from the main browser
+            results: Queue receiving each profile, then None when done
+            stop: Set to make the worker finish early
+            **search: Arguments for scrape_search_results()
+        """
+        if stop.is_set():
+            return
+
+        try:
+            with LinkedInScraper(
+                headless=self.headless,
+                block_assets=self.block_assets,
+                storage_state=storage_state,
+                seen=self.seen,
+            ) as worker:
+                for profile in worker.scrape_search_results(**search, show_progress=False, stop=stop):
+                    if stop.is_set():
+                        break
+                    results.put(profile)
+
+        except Exception as e:
+            logger.error(f"Search for {search['job_title']} failed: {e}")
+
+        finally:
+            results.put(None)
@@ -1,13 +1,46 @@
 """Open to Work badge detection."""
 
+import math
+import re
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+from typing import Optional
 from PIL import Image
 from playwright.sync_api import Locator
+from selectolax.lexbor import LexborHTMLParser
 from ..utils.logger import get_logger
 
 logger = get_logger()
 
+# One keep-alive connection pool for every profile photo download. Concurrent
+# searches share it, so downloads across all threads are capped at its size.
+MAX_DOWNLOADS = 8
+http_session = requests.Session()
+http_session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=MAX_DOWNLOADS))
+_download_slots = threading.BoundedSemaphore(MAX_DOWNLOADS)
+
+# Unit-circle offsets sampled every 10 degrees, computed once
+RING_OFFSETS = [
+    (math.cos(math.radians(angle)), math.sin(math.radians(angle)))
+    for angle in range(0, 360, 10)
+]
+
+# Analysis results by photo URL without its query string, which only holds
+# expiring access tokens. Failed downloads are not cached.
+GREEN_FRAME_CACHE_SIZE = 4096
+_green_frame_cache: dict[str, bool] = {}
+_green_frame_lock = threading.Lock()
+
+
+def _remember_green_frame(key: str, has_frame: bool) -> None:
+    """Cache a green frame result, evicting the oldest once full."""
+    with _green_frame_lock:
+        if len(_green_frame_cache) >= GREEN_FRAME_CACHE_SIZE:
+            del _green_frame_cache[next(iter(_green_frame_cache))]
+        _green_frame_cache[key] = has_frame
+
 
 def detect_green_frame(image_url: str) -> bool:
     """
@@ -16,19 +49,30 @@ def detect_green_frame(image_url: str) -> bool:
     The frame is a green ring around the circular profile photo.
     LinkedIn's Open to Work green is approximately RGB(98, 164, 113) / #62a471
 
+    Results are cached per photo, so a person appearing in several searches
+    is only downloaded once.
+
     Args:
         image_url: URL of the profile photo
 
     Returns:
         True if green frame detected
     """
+    key = image_url.split("?", 1)[0]
+    with _green_frame_lock:
+        cached = _green_frame_cache.get(key)
+    if cached is not None:
+        return cached
+
     try:
-        response = requests.get(image_url, timeout=5)
+        with _download_slots:
+            response = http_session.get(image_url, timeout=5)
         if response.status_code != 200:
             return False
 
         img = Image.open(BytesIO(response.content)).convert('RGB')
         width, height = img.size
+        pixels = img.load()
 
         # Check pixels around the edge (the frame area)
         # Sample points at ~5% from edge around the circle
@@ -41,14 +85,12 @@ def detect_green_frame(image_url: str) -> bool:
         # Sample at 95% of radius (edge area where frame appears)
         check_radius = int(radius * 0.95)
 
-        import math
-        for angle in range(0, 360, 10):  # Sample every 10 degrees
-            rad = math.radians(angle)
-            x = int(center_x + check_radius * math.cos(rad))
-            y = int(center_y + check_radius * math.sin(rad))
+        for cos, sin in RING_OFFSETS:  # Sample every 10 degrees
+            x = int(center_x + check_radius * cos)
+            y = int(center_y + check_radius * sin)
 
             if 0 <= x < width and 0 <= y < height:
-                r, g, b = img.getpixel((x, y))
+                r, g, b = pixels[x, y]
                 total_samples += 1
 
                 # Check for LinkedIn's Open to Work green
@@ -57,17 +99,38 @@ def detect_green_frame(image_url: str) -> bool:
                     green_pixels += 1
 
         # If more than 50% of edge samples are green, likely has the frame
-        if total_samples > 0 and (green_pixels / total_samples) > 0.5:
+        has_frame = total_samples > 0 and (green_pixels / total_samples) > 0.5
+        if has_frame:
             logger.debug(f"Green frame detected: {green_pixels}/{total_samples} samples")
-            return True
 
-        return False
+        _remember_green_frame(key, has_frame)
+        return has_frame
 
     except Exception as e:
         logger.debug(f"Error checking green frame: {e}")
         return False
 
 
+def detect_green_frames(image_urls: list[str], max_workers: int = MAX_DOWNLOADS) -> dict[str, bool]:
+    """
+    Run detect_green_frame() on several photos, downloading them in parallel.
+
+    Args:
+        image_urls: URLs of the profile photos, duplicates allowed
+        max_workers: Maximum concurrent downloads for this call; all calls
+            together never exceed MAX_DOWNLOADS
+
+    Returns:
+        Mapping of each distinct URL to its detection result
+    """
+    unique_urls = list(dict.fromkeys(image_urls))
+    if len(unique_urls) <= 1:
+        return {url: detect_green_frame(url) for url in unique_urls}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_urls))) as pool:
+        return dict(zip(unique_urls, pool.map(detect_green_frame, unique_urls)))
+
+
 class OpenToWorkDetector:
     """Detect Open to Work status on LinkedIn profiles."""
 
@@ -114,6 +177,29 @@ class OpenToWorkDetector:
         "rgb(112, 181, 249)",
     ]
 
+    # Compiled once into single alternations, so text is scanned in one
+    # pass instead of once per indicator. Cards are checked for text and
+    # photo frame indicators together; image src/alt attributes are part of
+    # the card HTML, so that one scan covers them too. Profile pages run to
+    # megabytes, so their pattern ignores case instead of needing a
+    # lowercased copy.
+    _TEXT_PATTERN = re.compile("|".join(map(re.escape, OPEN_TO_WORK_INDICATORS)), re.IGNORECASE)
+    _CARD_PATTERN = re.compile(
+        "|".join(map(re.escape, OPEN_TO_WORK_INDICATORS + PHOTO_FRAME_INDICATORS))
+    )
+
+    # Every card indicator contains one of these. Most cards contain none,
+    # and plain substring tests rule them out several times faster than the
+    # regex scan.
+    _CARD_KEYWORDS = ("open", "seek", "available", "looking", "#70b5f9", "rgb(112")
+
+    @classmethod
+    def _match_card_text(cls, card_html: str) -> Optional[re.Match]:
+        """Find the first text or photo frame indicator in lowercased card HTML."""
+        if not any(keyword in card_html for keyword in cls._CARD_KEYWORDS):
+            return None
+        return cls._CARD_PATTERN.search(card_html)
+
     @classmethod
     def detect_from_card(cls, card_element: Locator) -> bool:
         """
@@ -133,11 +219,11 @@ class OpenToWorkDetector:
         try:
             card_html = card_element.inner_html().lower()
 
-            # Method 1: Text indicators
-            for indicator in cls.OPEN_TO_WORK_INDICATORS:
-                if indicator in card_html:
-                    logger.debug(f"Open to Work detected via text: {indicator}")
-                    return True
+            # Method 1: Text and photo frame indicators, image attributes included
+            match = cls._match_card_text(card_html)
+            if match:
+                logger.debug(f"Open to Work detected via text: {match.group()}")
+                return True
 
             # Method 2: CSS selectors
             for selector in cls.BADGE_SELECTORS:
@@ -148,24 +234,11 @@ class OpenToWorkDetector:
                 except Exception:
                     continue
 
-            # Method 3: Photo frame indicators in HTML
-            for indicator in cls.PHOTO_FRAME_INDICATORS:
-                if indicator in card_html:
-                    return True
-
-            # Method 4: Check image attributes
-            img_elements = card_element.locator("img")
-            for i in range(img_elements.count()):
+            # Method 3: Image analysis for green frame (profile photos only)
+            # Pin the images once instead of re-querying them via nth(i)
+            for img in card_element.locator("img").element_handles():
                 try:
-                    img = img_elements.nth(i)
                     src = img.get_attribute("src") or ""
-                    alt = img.get_attribute("alt") or ""
-
-                    combined = (src + alt).lower()
-                    if any(ind in combined for ind in cls.OPEN_TO_WORK_INDICATORS):
-                        return True
-
-                    # Method 5: Image analysis for green frame (profile photos only)
                     if src and ("profile" in src or "media.licdn" in src) and "100_100" in src:
                         if detect_green_frame(src):
                             logger.debug("Open to Work detected via green frame analysis")
@@ -179,6 +252,97 @@ class OpenToWorkDetector:
             logger.debug(f"Error detecting Open to Work: {e}")
             return False
 
+    @classmethod
+    def detect_from_html(cls, html: str) -> bool:
+        """
+        Detect Open to Work status from a search result card's outer HTML.
+
+        Runs the same checks as detect_from_card() on HTML pulled from the
+        page in one batch, so no browser round-trips happen per card.
+
+        Args:
+            html: Outer HTML of the card element
+
+        Returns:
+            True if Open to Work badge is detected
+        """
+        try:
+            detected, photo_urls = cls._scan_html(html)
+            return detected or any(detect_green_frame(url) for url in photo_urls)
+
+        except Exception as e:
+            logger.debug(f"Error detecting Open to Work: {e}")
+            return False
+
+    @classmethod
+    def detect_many_from_html(cls, htmls: list[str]) -> list[bool]:
+        """
+        Detect Open to Work status for a page of cards at once.
+
+        Cards are first checked in-process; the profile photos of the cards
+        still undecided are then downloaded in parallel for green frame
+        analysis.
+
+        Args:
+            htmls: Outer HTML of each card element
+
+        Returns:
+            Detection result for each card, in order
+        """
+        scans = []
+        for html in htmls:
+            try:
+                scans.append(cls._scan_html(html))
+            except Exception as e:
+                logger.debug(f"Error detecting Open to Work: {e}")
+                scans.append((False, []))
+
+        frames = detect_green_frames(
+            [url for detected, photo_urls in scans if not detected for url in photo_urls]
+        )
+
+        return [
+            detected or any(frames.get(url, False) for url in photo_urls)
+            for detected, photo_urls in scans
+        ]
+
+    @classmethod
+    def _scan_html(cls, html: str) -> tuple[bool, list[str]]:
+        """
+        Run the checks that need no network access on a card's HTML.
+
+        Args:
+            html: Outer HTML of the card element
+
+        Returns:
+            Whether Open to Work was detected, and if not, the profile photo
+            URLs left for green frame analysis
+        """
+        card_html = html.lower()
+
+        match = cls._match_card_text(card_html)
+        if match:
+            logger.debug(f"Open to Work detected via text: {match.group()}")
+            return True, []
+
+        tree = LexborHTMLParser(html)
+
+        for selector in cls.BADGE_SELECTORS:
+            try:
+                if tree.css_first(selector) is not None:
+                    logger.debug(f"Open to Work detected via selector: {selector}")
+                    return True, []
+            except Exception:
+                continue
+
+        photo_urls = []
+        for img in tree.css("img"):
+            src = img.attributes.get("src") or ""
+            if src and ("profile" in src or "media.licdn" in src) and "100_100" in src:
+                photo_urls.append(src)
+
+        return False, photo_urls
+
     @classmethod
     def detect_from_profile_page(cls, page) -> bool:
         """
@@ -191,11 +355,8 @@ class OpenToWorkDetector:
             True if Open to Work status is detected
         """
         try:
-            page_content = page.content().lower()
-
-            for indicator in cls.OPEN_TO_WORK_INDICATORS:
-                if indicator in page_content:
-                    return True
+            if cls._TEXT_PATTERN.search(page.content()):
+                return True
 
             for selector in cls.BADGE_SELECTORS:
                 try:
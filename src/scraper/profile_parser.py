@@ -5,12 +5,30 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 from playwright.sync_api import Locator
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 from ..utils.logger import get_logger
 
 logger = get_logger()
 
 
-@dataclass
+def node_text(node: LexborNode) -> str:
+    """
+    Approximate a node's rendered innerText from its text content.
+
+    Collapses whitespace within lines and drops blank lines, which is how
+    LinkedIn's indented markup renders.
+
+    Args:
+        node: Parsed HTML node
+
+    Returns:
+        Text with one non-empty line per rendered line
+    """
+    lines = (" ".join(line.split()) for line in node.text(deep=True).splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+@dataclass(slots=True)
 class ProfileData:
     """Data structure for a LinkedIn profile."""
 
@@ -72,6 +90,15 @@ class ProfileParser:
         ],
     }
 
+    # Compiled once rather than looked up in re's cache on every card
+    _WHITESPACE_PATTERN = re.compile(r"\s+")
+    _PARENTHESES_PATTERN = re.compile(r"\([^)]*\)")
+    _AFTER_COMMA_PATTERN = re.compile(r",.*$")
+    _COMPANY_PATTERNS = [
+        re.compile(r"(?:at|@|chez|presso|bei)\s+(.+?)(?:\s*[|\-]|$)", re.IGNORECASE),
+        re.compile(r"[|\-]\s*(.+?)(?:\s*[|\-]|$)", re.IGNORECASE),
+    ]
+
     @classmethod
     def parse_name(cls, full_name: str) -> tuple[str, str]:
         """
@@ -84,9 +111,9 @@ class ProfileParser:
             Tuple of (first_name, last_name)
         """
         full_name = full_name.strip()
-        full_name = re.sub(r"\s+", " ", full_name)
-        full_name = re.sub(r"\([^)]*\)", "", full_name).strip()
-        full_name = re.sub(r",.*$", "", full_name).strip()
+        full_name = cls._WHITESPACE_PATTERN.sub(" ", full_name)
+        full_name = cls._PARENTHESES_PATTERN.sub("", full_name).strip()
+        full_name = cls._AFTER_COMMA_PATTERN.sub("", full_name).strip()
 
         parts = full_name.split(" ")
 
@@ -108,13 +135,8 @@ class ProfileParser:
         Returns:
             Company name if found
         """
-        patterns = [
-            r"(?:at|@|chez|presso|bei)\s+(.+?)(?:\s*[|\-]|$)",
-            r"[|\-]\s*(.+?)(?:\s*[|\-]|$)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, headline, re.IGNORECASE)
+        for pattern in cls._COMPANY_PATTERNS:
+            match = pattern.search(headline)
             if match:
                 company = match.group(1).strip()
                 if company and len(company) > 1:
@@ -127,6 +149,9 @@ class ProfileParser:
         """
         Parse a search result card into ProfileData.
 
+        The card's HTML is read in a single browser round-trip and parsed
+        in-process, instead of one count()/inner_text() call per selector.
+
         Args:
             card: Playwright locator for the card element
             is_open_to_work: Whether Open to Work badge was detected
@@ -135,67 +160,78 @@ class ProfileParser:
             ProfileData if parsing successful, None otherwise
         """
         try:
+            html = card.evaluate("(el) => el.outerHTML")
+        except Exception as e:
+            logger.debug(f"Error parsing card: {e}")
+            return None
+
+        return cls.parse_card_html(html, is_open_to_work=is_open_to_work)
+
+    @classmethod
+    def _select_text(cls, tree: LexborHTMLParser, field: str) -> str:
+        """Get the text of the first node matching one of a field's selectors."""
+        for selector in cls.CARD_SELECTORS[field]:
+            try:
+                node = tree.css_first(selector)
+            except Exception:
+                continue
+            if node is not None:
+                return node_text(node)
+
+        return ""
+
+    @classmethod
+    def parse_card_html(cls, html: str, is_open_to_work: bool = False) -> Optional[ProfileData]:
+        """
+        Parse a search result card's outer HTML into ProfileData.
+
+        Applies CARD_SELECTORS to HTML pulled from the page, so no browser
+        round-trips happen per field.
+
+        Args:
+            html: Outer HTML of the card element
+            is_open_to_work: Whether Open to Work badge was detected
+
+        Returns:
+            ProfileData if parsing successful, None otherwise
+        """
+        try:
+            tree = LexborHTMLParser(html)
             profile = ProfileData(is_open_to_work=is_open_to_work)
 
-            for selector in cls.CARD_SELECTORS["name"]:
-                try:
-                    name_el = card.locator(selector).first
-                    if name_el.count() > 0:
-                        profile.full_name = name_el.inner_text().strip()
-                        break
-                except Exception:
-                    continue
+            profile.full_name = cls._select_text(tree, "name")
 
             if not profile.full_name:
                 # Fallback: find links to profile pages
-                try:
-                    all_links = card.locator("a").all()
-                    for link in all_links:
-                        href = link.get_attribute("href") or ""
-                        if "/in/" in href:
-                            text = link.inner_text().strip()
-                            if text and len(text) > 2:
-                                profile.full_name = text.split("\n")[0].strip()
-                                profile.profile_url = href.split("?")[0]
-                                break
-                except Exception:
-                    pass
+                for link in tree.css("a"):
+                    href = link.attributes.get("href") or ""
+                    if "/in/" in href:
+                        text = node_text(link)
+                        if text and len(text) > 2:
+                            profile.full_name = text.split("\n")[0].strip()
+                            profile.profile_url = href.split("?")[0]
+                            break
 
             if profile.full_name:
                 profile.first_name, profile.last_name = cls.parse_name(profile.full_name)
 
-            for selector in cls.CARD_SELECTORS["headline"]:
-                try:
-                    headline_el = card.locator(selector).first
-                    if headline_el.count() > 0:
-                        profile.headline = headline_el.inner_text().strip()
-                        break
-                except Exception:
-                    continue
+            profile.headline = cls._select_text(tree, "headline")
 
             if profile.headline:
                 profile.current_company = cls.extract_company_from_headline(profile.headline)
 
-            for selector in cls.CARD_SELECTORS["location"]:
-                try:
-                    loc_el = card.locator(selector).first
-                    if loc_el.count() > 0:
-                        profile.location = loc_el.inner_text().strip()
-                        break
-                except Exception:
-                    continue
+            profile.location = cls._select_text(tree, "location")
 
             if not profile.profile_url:
                 for selector in cls.CARD_SELECTORS["link"]:
                     try:
-                        link_el = card.locator(selector).first
-                        if link_el.count() > 0:
-                            href = link_el.get_attribute("href")
-                            if href:
-                                profile.profile_url = href.split("?")[0]
-                                break
+                        link = tree.css_first(selector)
                     except Exception:
                         continue
+                    href = link.attributes.get("href") if link is not None else None
+                    if href:
+                        profile.profile_url = href.split("?")[0]
+                        break
 
             if not profile.full_name and not profile.profile_url:
                 return None
@@ -203,5 +239,5 @@ class ProfileParser:
             return profile
 
         except Exception as e:
-            logger.debug(f"Error parsing card: {e}")
+            logger.debug(f"Error parsing card HTML: {e}")
             return None
@@ -1,9 +1,38 @@
 """LinkedIn search functionality."""
 
+import functools
+import string
 import urllib.parse
 from typing import Optional
 from ..config import config
 
+# The configuration is frozen, so these are fixed for the process
+SEARCH_URL = config.LINKEDIN_SEARCH_URL
+STATIC_SEARCH_PARAMS = {"origin": "GLOBAL_SEARCH_HEADER", "sid": "search"}
+STATIC_QUERY = urllib.parse.urlencode(STATIC_SEARCH_PARAMS)
+
+# Characters left unescaped in search query values
+QUERY_SAFE = '[]"'
+
+# Characters urllib.parse.quote never escapes
+UNRESERVED = frozenset(string.ascii_letters + string.digits + "-_.~ ")
+
+
+def _quote(value: str) -> str:
+    """
+    Percent-encode a path-style query value, skipping the general quoter
+    for plain words.
+
+    Args:
+        value: Text to encode
+
+    Returns:
+        Same result as urllib.parse.quote(value)
+    """
+    if UNRESERVED.issuperset(value):
+        return value.replace(" ", "%20")
+    return urllib.parse.quote(value)
+
 
 def build_search_url(
     job_title: str,
@@ -23,30 +52,26 @@ def build_search_url(
     Returns:
         Complete search URL
     """
-    base_url = config.LINKEDIN_SEARCH_URL
-
+    quote = urllib.parse.quote_plus
     keywords = f'"{job_title}"'
 
-    params = {
-        "keywords": keywords,
-        "origin": "GLOBAL_SEARCH_HEADER",
-        "sid": "search",
-    }
+    # Same output as urlencode(params, safe=QUERY_SAFE) for this fixed shape
+    parts = [f"keywords={quote(keywords, safe=QUERY_SAFE)}", STATIC_QUERY]
 
     if location:
-        params["geoUrn"] = f'["{location}"]'
+        geo_urn = f'["{location}"]'
+        parts.append(f"geoUrn={quote(geo_urn, safe=QUERY_SAFE)}")
 
     if page > 1:
-        params["page"] = str(page)
+        parts.append(f"page={page}")
 
     if network:
-        params["network"] = str(network)
-
-    query_string = urllib.parse.urlencode(params, safe='[]"')
+        parts.append(f"network={quote(str(network), safe=QUERY_SAFE)}")
 
-    return f"{base_url}?{query_string}"
+    return f"{SEARCH_URL}?{'&'.join(parts)}"
 
 
+@functools.cache
 def build_search_url_simple(job_title: str, location: str, open_to_work_only: bool = False) -> str:
     """
     Build a simple LinkedIn search URL with proper location filtering.
@@ -59,13 +84,13 @@ def build_search_url_simple(job_title: str, location: str, open_to_work_only: bo
     Returns:
         Complete search URL
     """
-    encoded_keywords = urllib.parse.quote(job_title)
+    encoded_keywords = _quote(job_title)
 
-    url = f"{config.LINKEDIN_SEARCH_URL}?keywords={encoded_keywords}&origin=GLOBAL_SEARCH_HEADER"
+    url = f"{SEARCH_URL}?keywords={encoded_keywords}&origin=GLOBAL_SEARCH_HEADER"
 
     # Add location as a separate filter parameter
     if location:
-        encoded_location = urllib.parse.quote(location)
+        encoded_location = _quote(location)
         url += f"&location={encoded_location}"
 
     return url
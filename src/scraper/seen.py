@@ -0,0 +1,179 @@
+"""Persistent store of already-scraped profiles."""
+
+import hashlib
+import math
+import sqlite3
+import threading
+from pathlib import Path
+
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+
+def url_hash(url: str) -> int:
+    """
+    Hash a profile URL to a stable 64-bit integer.
+
+    Storing 8-byte hashes instead of full URLs keeps the de-duplication set
+    small on long sessions; collisions are negligible at this scale.
+
+    Args:
+        url: Profile URL
+
+    Returns:
+        64-bit hash of the URL
+    """
+    # Signed so the value fits SQLite's 64-bit INTEGER column
+    digest = hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 64-bit url_hash() values."""
+
+    def __init__(self, capacity: int, error_rate: float = 1e-4):
+        """
+        Initialize an empty filter.
+
+        Args:
+            capacity: Number of keys the filter is sized for
+            error_rate: False positive rate at capacity
+        """
+        capacity = max(capacity, 1)
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: int):
+        """Yield the bit positions a key sets."""
+        # The key is already a uniform hash, so its two halves drive
+        # double hashing instead of k independent hash functions
+        key &= 0xFFFFFFFFFFFFFFFF
+        h1, h2 = key & 0xFFFFFFFF, (key >> 32) | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def __contains__(self, key: int) -> bool:
+        """Check whether a key may have been added (false positives possible)."""
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def add(self, key: int) -> None:
+        """
+        Add a key to the filter.
+
+        Args:
+            key: Hash from url_hash()
+        """
+        bits = self._bits
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+
+class SeenStore:
+    """
+    Profile URL hashes kept in SQLite so resumed runs skip known profiles.
+
+    Membership is answered by an in-memory Bloom filter (about 2.5 bytes per
+    profile) and only confirmed against the database on a filter hit.
+    """
+
+    def __init__(self, filepath: Path, flush_every: int = 100, headroom: int = 100_000):
+        """
+        Initialize the store.
+
+        Args:
+            filepath: SQLite database path
+            flush_every: Number of new hashes buffered before writing to disk
+            headroom: New profiles the Bloom filter is sized for on top of
+                those already stored
+        """
+        self.filepath = filepath
+        self.flush_every = flush_every
+        self.headroom = headroom
+        self._bloom = BloomFilter(headroom)
+        self._count = 0
+        self._pending: set[int] = set()
+        self._conn = None
+        # Lookups also come from the card-processing thread
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        """Context manager entry."""
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def __contains__(self, key: int) -> bool:
+        """Check whether a profile hash has been recorded."""
+        if key not in self._bloom:
+            return False
+
+        with self._lock:
+            if key in self._pending:
+                return True
+            if self._conn is None:
+                return False
+            row = self._conn.execute("SELECT 1 FROM seen WHERE url_hash = ?", (key,)).fetchone()
+            return row is not None
+
+    def __len__(self) -> int:
+        """Number of recorded profile hashes."""
+        return self._count
+
+    def open(self) -> None:
+        """Open the database and load every known hash into the Bloom filter."""
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.filepath, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS seen (url_hash INTEGER PRIMARY KEY)")
+
+        (self._count,) = self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()
+        self._bloom = BloomFilter(self._count + self.headroom)
+        for (key,) in self._conn.execute("SELECT url_hash FROM seen"):
+            self._bloom.add(key)
+
+        logger.info(f"Loaded {self._count} previously scraped profiles from {self.filepath}")
+
+    def close(self) -> None:
+        """Write pending hashes and close the database."""
+        if self._conn is None:
+            return
+
+        self.flush()
+        with self._lock:
+            self._conn.close()
+            self._conn = None
+
+    def add(self, key: int) -> None:
+        """
+        Record a profile hash.
+
+        Args:
+            key: Hash from url_hash()
+        """
+        if key in self:
+            return
+
+        with self._lock:
+            self._bloom.add(key)
+            self._pending.add(key)
+            self._count += 1
+
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered hashes to disk."""
+        with self._lock:
+            if not self._pending or self._conn is None:
+                return
+
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO seen (url_hash) VALUES (?)",
+                    ((key,) for key in self._pending),
+                )
+            self._pending.clear()
@@ -1,12 +1,14 @@
 """Utility modules."""
 
-from .delays import human_delay, long_pause
+from .delays import human_delay, long_pause, next_delay, sleep_until
 from .logger import setup_logger, get_logger
 from .browser import get_chrome_user_data_dir
 
 __all__ = [
     "human_delay",
     "long_pause",
+    "next_delay",
+    "sleep_until",
     "setup_logger",
     "get_logger",
     "get_chrome_user_data_dir",
@@ -1,12 +1,18 @@
 """Browser utilities."""
 
+import functools
 import os
-import platform
 import shutil
+import sys
 from pathlib import Path
 from ..config import config
 
+# Checked once at import; sys.platform is a constant, unlike platform.system()
+IS_WINDOWS = sys.platform == "win32"
+IS_MACOS = sys.platform == "darwin"
 
+
+@functools.cache
 def get_chrome_user_data_dir() -> str:
     """
     Get a dedicated Chrome user data directory for Playwright.
@@ -19,12 +25,10 @@ def get_chrome_user_data_dir() -> str:
         return config.CHROME_USER_DATA_DIR
 
     # Use a dedicated directory for Playwright to avoid conflicts
-    system = platform.system()
-    
-    if system == "Windows":
+    if IS_WINDOWS:
         local_app_data = os.environ.get("LOCALAPPDATA", "")
         playwright_profile = Path(local_app_data) / "Google" / "Chrome" / "PlaywrightProfile"
-    elif system == "Darwin":
+    elif IS_MACOS:
         playwright_profile = Path.home() / "Library" / "Application Support" / "Google" / "Chrome" / "PlaywrightProfile"
     else:
         playwright_profile = Path.home() / ".config" / "google-chrome-playwright"
@@ -35,6 +39,7 @@ def get_chrome_user_data_dir() -> str:
     return str(playwright_profile)
 
 
+@functools.cache
 def get_original_chrome_user_data_dir() -> str:
     """
     Get the original Chrome user data directory.
@@ -42,17 +47,16 @@ def get_original_chrome_user_data_dir() -> str:
     Returns:
         Path to original Chrome user data directory
     """
-    system = platform.system()
-
-    if system == "Windows":
+    if IS_WINDOWS:
         local_app_data = os.environ.get("LOCALAPPDATA", "")
         return str(Path(local_app_data) / "Google" / "Chrome" / "User Data")
-    elif system == "Darwin":
+    elif IS_MACOS:
         return str(Path.home() / "Library" / "Application Support" / "Google" / "Chrome")
     else:
         return str(Path.home() / ".config" / "google-chrome")
 
 
+@functools.cache
 def get_chrome_executable() -> str:
     """
     Get Chrome executable path for the current platform.
@@ -60,9 +64,7 @@ def get_chrome_executable() -> str:
     Returns:
         Path to Chrome executable
     """
-    system = platform.system()
-
-    if system == "Windows":
+    if IS_WINDOWS:
         paths = [
             Path(os.environ.get("PROGRAMFILES", "")) / "Google" / "Chrome" / "Application" / "chrome.exe",
             Path(os.environ.get("PROGRAMFILES(X86)", "")) / "Google" / "Chrome" / "Application" / "chrome.exe",
@@ -72,7 +74,7 @@ def get_chrome_executable() -> str:
             if path.exists():
                 return str(path)
         return "chrome.exe"
-    elif system == "Darwin":
+    elif IS_MACOS:
         return "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
     else:
         return "google-chrome"
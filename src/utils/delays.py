@@ -4,6 +4,27 @@ import random
 import time
 from ..config import config
 
+# The configuration is frozen, so read the delay settings once
+MIN_DELAY = config.MIN_DELAY
+MAX_DELAY = config.MAX_DELAY
+LONG_PAUSE_DURATION = config.LONG_PAUSE_DURATION
+
+
+def next_delay(min_sec: float = None, max_sec: float = None) -> float:
+    """
+    Draw a human-like delay without waiting.
+
+    Args:
+        min_sec: Minimum delay in seconds (default: config.MIN_DELAY)
+        max_sec: Maximum delay in seconds (default: config.MAX_DELAY)
+
+    Returns:
+        Delay in seconds
+    """
+    min_sec = min_sec if min_sec is not None else MIN_DELAY
+    max_sec = max_sec if max_sec is not None else MAX_DELAY
+    return random.uniform(min_sec, max_sec)
+
 
 def human_delay(min_sec: float = None, max_sec: float = None) -> None:
     """
@@ -13,21 +34,24 @@ def human_delay(min_sec: float = None, max_sec: float = None) -> None:
         min_sec: Minimum delay in seconds (default: config.MIN_DELAY)
         max_sec: Maximum delay in seconds (default: config.MAX_DELAY)
     """
-    min_sec = min_sec if min_sec is not None else config.MIN_DELAY
-    max_sec = max_sec if max_sec is not None else config.MAX_DELAY
-    delay = random.uniform(min_sec, max_sec)
-    time.sleep(delay)
+    time.sleep(next_delay(min_sec, max_sec))
+
+
+def sleep_until(deadline: float) -> None:
+    """
+    Wait out whatever is left of a delay started earlier.
+
+    Args:
+        deadline: time.monotonic() value to wait for
+    """
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
 
 
 def long_pause() -> None:
     """Take a longer pause to avoid detection."""
-    base_duration = config.LONG_PAUSE_DURATION
+    base_duration = LONG_PAUSE_DURATION
     variation = random.uniform(-5, 10)
     duration = max(10, base_duration + variation)
     time.sleep(duration)
-
-
-def scroll_pause() -> None:
-    """Short pause after scrolling."""
-    delay = random.uniform(config.SCROLL_PAUSE, config.SCROLL_PAUSE + 0.5)
-    time.sleep(delay)
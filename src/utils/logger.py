@@ -1,14 +1,34 @@
 """Logging utilities."""
 
+import functools
 import logging
-from rich.logging import RichHandler
-from rich.console import Console
 
-console = Console()
 
-_logger = None
+@functools.cache
+def get_console():
+    """Get the console log records are written to, creating it on first use."""
+    from rich.console import Console
+    return Console()
 
 
+class _DeferredRichHandler(logging.Handler):
+    """Handler that imports rich and builds its RichHandler on the first record."""
+
+    def __init__(self):
+        """Initialize the handler without importing rich."""
+        super().__init__()
+        self._handler = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record through the RichHandler, creating it first if needed."""
+        if self._handler is None:
+            from rich.logging import RichHandler
+            self._handler = RichHandler(console=get_console(), rich_tracebacks=True)
+            self._handler.setFormatter(self.formatter)
+        self._handler.handle(record)
+
+
+@functools.cache
 def setup_logger(name: str = "linkedin_scraper", level: int = logging.INFO) -> logging.Logger:
     """
     Set up and return a configured logger.
@@ -20,24 +40,16 @@ def setup_logger(name: str = "linkedin_scraper", level: int = logging.INFO) -> l
     Returns:
         Configured logger instance
     """
-    global _logger
-
-    if _logger is not None:
-        return _logger
-
     logging.basicConfig(
         level=level,
         format="%(message)s",
         datefmt="[%X]",
-        handlers=[RichHandler(console=console, rich_tracebacks=True)],
+        handlers=[_DeferredRichHandler()],
     )
 
-    _logger = logging.getLogger(name)
-    return _logger
+    return logging.getLogger(name)
 
 
 def get_logger() -> logging.Logger:
     """Get the configured logger instance."""
-    if _logger is None:
-        return setup_logger()
-    return _logger
+    return setup_logger()
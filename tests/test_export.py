@@ -0,0 +1,93 @@
+"""Tests for CSV export."""
+
+import csv
+from datetime import datetime
+
+import pytest
+from src.export.csv_export import CSVExporter, CSVAppender
+from src.scraper.profile_parser import ProfileData
+
+
+@pytest.fixture
+def profiles():
+    """Profiles with values that need CSV quoting."""
+    scraped_at = datetime(2026, 2, 1, 15, 30, 45)
+    return [
+        ProfileData(
+            first_name="John",
+            last_name="Doe",
+            full_name="John Doe",
+            headline='QA Engineer at "Acme, Inc."',
+            current_company='"Acme, Inc."',
+            location="Lille, France",
+            profile_url="https://www.linkedin.com/in/johndoe",
+            is_open_to_work=True,
+            scraped_at=scraped_at,
+        ),
+        ProfileData(
+            first_name="Jane",
+            headline="Line one\nLine two",
+            scraped_at=scraped_at,
+        ),
+    ]
+
+
+def read_rows(filepath):
+    """Read a CSV file back with the standard csv module."""
+    with open(filepath, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+class TestCSVExporter:
+    """Test CSVExporter functionality."""
+
+    def test_export_round_trip(self, tmp_path, profiles):
+        """Test that exported rows read back as the original values."""
+        filepath = CSVExporter.export(profiles, filename="out.csv", output_dir=tmp_path)
+        rows = read_rows(filepath)
+
+        assert rows[0] == CSVExporter.HEADERS
+        assert rows[1] == [
+            "John",
+            "Doe",
+            "John Doe",
+            'QA Engineer at "Acme, Inc."',
+            '"Acme, Inc."',
+            "Lille, France",
+            "https://www.linkedin.com/in/johndoe",
+            "True",
+            "2026-02-01T15:30:45",
+        ]
+        assert rows[2][3] == "Line one\nLine two"
+
+    def test_append_many_writes_header_once(self, tmp_path, profiles):
+        """Test that repeated appends write a single header."""
+        filepath = tmp_path / "out.csv"
+        CSVExporter.append(profiles[0], filepath)
+        CSVExporter.append_many(profiles[1:], filepath)
+
+        rows = read_rows(filepath)
+        assert rows[0] == CSVExporter.HEADERS
+        assert [row[0] for row in rows[1:]] == ["John", "Jane"]
+
+    def test_appender_matches_export(self, tmp_path, profiles):
+        """Test that CSVAppender output matches a full export."""
+        exported = CSVExporter.export(profiles, filename="export.csv", output_dir=tmp_path)
+        appended = tmp_path / "append.csv"
+
+        with CSVAppender(appended) as appender:
+            for profile in profiles:
+                appender.append(profile)
+
+        assert appended.read_bytes() == exported.read_bytes()
+
+    def test_append_after_delete_rewrites_header(self, tmp_path, profiles):
+        """Test that appending to a file deleted since the last append writes a header."""
+        filepath = tmp_path / "out.csv"
+        CSVExporter.append(profiles[0], filepath)
+        filepath.unlink()
+        CSVExporter.append(profiles[1], filepath)
+
+        rows = read_rows(filepath)
+        assert rows[0] == CSVExporter.HEADERS
+        assert [row[0] for row in rows[1:]] == ["Jane"]
@@ -0,0 +1,61 @@
+"""Tests for the LinkedIn scraper's browser-free card processing."""
+
+from src.scraper.linkedin import LinkedInScraper
+from src.scraper.seen import url_hash
+
+
+def card(slug, name):
+    """Build a minimal search result card linking to a profile."""
+    return f'<li><a href="/in/{slug}?trk=x">{name}</a></li>'
+
+
+class TestProcessCards:
+    """Test LinkedInScraper._process_cards."""
+
+    def test_skips_profiles_in_seen_store(self, tmp_path):
+        """Test that profiles recorded by an earlier run are dropped."""
+        scraper = LinkedInScraper(seen_path=tmp_path / "seen.sqlite3")
+        scraper.seen.open()
+        try:
+            scraper.seen.add(url_hash("/in/johndoe"))
+
+            profiles = scraper._process_cards([card("johndoe", "John Doe"), None, card("janedoe", "Jane Doe")])
+
+            assert [p.full_name for p in profiles] == ["Jane Doe"]
+        finally:
+            scraper.seen.close()
+
+    def test_keeps_all_profiles_without_seen_store(self):
+        """Test that nothing is dropped when resuming is disabled."""
+        scraper = LinkedInScraper()
+
+        profiles = scraper._process_cards([card("johndoe", "John Doe"), card("janedoe", "Jane Doe")])
+
+        assert [p.full_name for p in profiles] == ["John Doe", "Jane Doe"]
+
+    def test_shared_seen_store_left_open(self, tmp_path):
+        """Test that a scraper sharing another's seen store does not close it."""
+        owner = LinkedInScraper(seen_path=tmp_path / "seen.sqlite3")
+        owner.seen.open()
+        try:
+            worker = LinkedInScraper(seen=owner.seen)
+            worker.close()
+
+            owner.seen.add(url_hash("/in/janedoe"))
+            assert worker._process_cards([card("janedoe", "Jane Doe")]) == []
+        finally:
+            owner.seen.close()
+
+    def test_profiles_without_url_not_skipped(self, tmp_path):
+        """Test that cards without a profile link are never matched against the store."""
+        scraper = LinkedInScraper(seen_path=tmp_path / "seen.sqlite3")
+        scraper.seen.open()
+        try:
+            scraper.seen.add(url_hash(""))
+            html = '<li><span class="actor-name">John Doe</span></li>'
+
+            profiles = scraper._process_cards([html])
+
+            assert [p.full_name for p in profiles] == ["John Doe"]
+        finally:
+            scraper.seen.close()
@@ -1,7 +1,16 @@
 """Tests for Open to Work detection."""
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from types import SimpleNamespace
+
 import pytest
-from src.scraper.opentowork import OpenToWorkDetector
+from PIL import Image, ImageDraw
+
+from src.scraper import opentowork
+from src.scraper.opentowork import OpenToWorkDetector, detect_green_frame
 
 
 class TestOpenToWorkDetector:
@@ -12,6 +21,12 @@ class TestOpenToWorkDetector:
         for indicator in OpenToWorkDetector.OPEN_TO_WORK_INDICATORS:
             assert indicator == indicator.lower()
 
+    def test_card_keywords_cover_indicators(self):
+        """Test that the keyword prefilter cannot hide any card indicator."""
+        indicators = OpenToWorkDetector.OPEN_TO_WORK_INDICATORS + OpenToWorkDetector.PHOTO_FRAME_INDICATORS
+        for indicator in indicators:
+            assert any(keyword in indicator for keyword in OpenToWorkDetector._CARD_KEYWORDS)
+
     def test_has_badge_selectors(self):
         """Test that badge selectors are defined."""
         assert len(OpenToWorkDetector.BADGE_SELECTORS) > 0
@@ -19,3 +34,95 @@ class TestOpenToWorkDetector:
     def test_has_photo_frame_indicators(self):
         """Test that photo frame indicators are defined."""
         assert len(OpenToWorkDetector.PHOTO_FRAME_INDICATORS) > 0
+
+    def test_detect_from_html_text(self):
+        """Test detection from a text indicator in card HTML."""
+        html = "<li><div>QA Engineer | #OpenToWork</div></li>"
+        assert OpenToWorkDetector.detect_from_html(html)
+
+    def test_detect_from_html_badge_selector(self):
+        """Test detection from a badge element in card HTML."""
+        html = '<li><div class="photo-frame--green"></div></li>'
+        assert OpenToWorkDetector.detect_from_html(html)
+
+    def test_detect_from_html_none(self):
+        """Test that a plain card is not detected."""
+        html = '<li><img src="https://example.com/logo.png" alt="Company logo"><div>QA Engineer</div></li>'
+        assert not OpenToWorkDetector.detect_from_html(html)
+
+
+class TestDetectGreenFrame:
+    """Test green frame analysis on profile photos."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start every test with an empty result cache."""
+        opentowork._green_frame_cache.clear()
+
+    @staticmethod
+    def _photo(ring_color):
+        """Build a 100x100 PNG with a ring of the given color near the edge."""
+        image = Image.new("RGB", (100, 100), (200, 200, 200))
+        ImageDraw.Draw(image).ellipse((0, 0, 99, 99), outline=ring_color, width=6)
+        buffer = BytesIO()
+        image.save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    def _patch_download(self, monkeypatch, content):
+        """Serve the given bytes for every image request."""
+        response = SimpleNamespace(status_code=200, content=content)
+        monkeypatch.setattr(opentowork.http_session, "get", lambda *args, **kwargs: response)
+
+    def test_green_ring_detected(self, monkeypatch):
+        """Test that a green ring around the photo is detected."""
+        self._patch_download(monkeypatch, self._photo((98, 164, 113)))
+        assert detect_green_frame("https://media.licdn.com/green.jpg")
+
+    def test_grey_photo_not_detected(self, monkeypatch):
+        """Test that a photo without a green ring is not flagged."""
+        self._patch_download(monkeypatch, self._photo((120, 120, 120)))
+        assert not detect_green_frame("https://media.licdn.com/grey.jpg")
+
+    def test_detect_many_from_html(self, monkeypatch):
+        """Test batch detection combines text checks and photo analysis."""
+        self._patch_download(monkeypatch, self._photo((98, 164, 113)))
+        photo = '<li><img src="https://media.licdn.com/dms/image/profile-displayphoto-shrink_100_100/a.jpg"></li>'
+        cards = ["<li>#opentowork</li>", "<li>Engineer</li>", photo, photo]
+
+        assert OpenToWorkDetector.detect_many_from_html(cards) == [True, False, True, True]
+
+    def test_result_cached_across_tokens(self, monkeypatch):
+        """Test that a photo is downloaded once even when its tokens change."""
+        calls = []
+        response = SimpleNamespace(status_code=200, content=self._photo((98, 164, 113)))
+        monkeypatch.setattr(
+            opentowork.http_session, "get", lambda url, **kwargs: calls.append(url) or response
+        )
+
+        assert detect_green_frame("https://media.licdn.com/photo.jpg?e=1&t=a")
+        assert detect_green_frame("https://media.licdn.com/photo.jpg?e=2&t=b")
+        assert len(calls) == 1
+
+    def test_downloads_capped_across_callers(self, monkeypatch):
+        """Test that concurrent batches never exceed the shared connection pool."""
+        response = SimpleNamespace(status_code=200, content=self._photo((120, 120, 120)))
+        lock = threading.Lock()
+        in_flight = [0]
+        peak = [0]
+
+        def get(url, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return response
+
+        monkeypatch.setattr(opentowork.http_session, "get", get)
+
+        batches = [[f"https://media.licdn.com/{i}/{j}.jpg" for j in range(8)] for i in range(4)]
+        with ThreadPoolExecutor(max_workers=len(batches)) as pool:
+            list(pool.map(opentowork.detect_green_frames, batches))
+
+        assert peak[0] <= opentowork.MAX_DOWNLOADS
@@ -1,7 +1,7 @@
 """Tests for profile parser."""
 
 import pytest
-from src.scraper.profile_parser import ProfileParser
+from src.scraper.profile_parser import ProfileData, ProfileParser
 
 
 class TestProfileParser:
@@ -75,3 +75,65 @@ class TestProfileParser:
             "Senior Software Engineer at Meta | Ex-Google"
         )
         assert company == "Meta"
+
+    def test_parse_card_html(self):
+        """Test parsing a search result card from its HTML."""
+        html = """
+        <li class="reusable-search__result-container">
+          <span class="entity-result__title-text">
+            <a href="https://www.linkedin.com/in/johndoe?miniProfileUrn=abc">
+              <span aria-hidden="true">John Doe</span>
+              <span class="visually-hidden">View John Doe's profile</span>
+            </a>
+          </span>
+          <div class="t-14 t-black t-normal">
+            QA Engineer at Acme
+          </div>
+          <div class="t-14 t-normal">Lille, France</div>
+        </li>
+        """
+        profile = ProfileParser.parse_card_html(html, is_open_to_work=True)
+        assert profile.full_name == "John Doe"
+        assert profile.first_name == "John"
+        assert profile.last_name == "Doe"
+        assert profile.headline == "QA Engineer at Acme"
+        assert profile.current_company == "Acme"
+        assert profile.location == "Lille, France"
+        assert profile.profile_url == "https://www.linkedin.com/in/johndoe"
+        assert profile.is_open_to_work
+
+    def test_parse_card_html_link_fallback(self):
+        """Test name and URL fallback from a profile link."""
+        html = """
+        <li>
+          <a href="/in/janedoe?trk=x">
+            Jane Doe
+            2nd degree connection
+          </a>
+        </li>
+        """
+        profile = ProfileParser.parse_card_html(html)
+        assert profile.full_name == "Jane Doe"
+        assert profile.profile_url == "/in/janedoe"
+
+    def test_parse_card_html_empty(self):
+        """Test that a card without name or link is skipped."""
+        assert ProfileParser.parse_card_html("<li><div>Ad</div></li>") is None
+
+
+class TestProfileData:
+    """Test ProfileData functionality."""
+
+    def test_uses_slots(self):
+        """Test that instances carry no per-instance __dict__."""
+        profile = ProfileData(full_name="John Doe")
+        assert not hasattr(profile, "__dict__")
+        assert "full_name" in ProfileData.__slots__
+
+    def test_to_dict(self):
+        """Test that to_dict reads every field."""
+        profile = ProfileData(full_name="John Doe", is_open_to_work=True)
+        data = profile.to_dict()
+        assert data["full_name"] == "John Doe"
+        assert data["is_open_to_work"] is True
+        assert data["scraped_at"] == profile.scraped_at.isoformat()
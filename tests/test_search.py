@@ -0,0 +1,49 @@
+"""Tests for search URL building."""
+
+import urllib.parse
+
+import pytest
+from src.scraper.search import SEARCH_URL, build_search_url, build_search_url_simple
+
+
+def reference_url(job_title, location, page=1, network=None):
+    """Build the URL the way build_search_url did with urlencode."""
+    params = {"keywords": f'"{job_title}"', "origin": "GLOBAL_SEARCH_HEADER", "sid": "search"}
+    if location:
+        params["geoUrn"] = f'["{location}"]'
+    if page > 1:
+        params["page"] = str(page)
+    if network:
+        params["network"] = str(network)
+    query_string = urllib.parse.urlencode(params, safe='[]"')
+    return f"{SEARCH_URL}?{query_string}"
+
+
+class TestBuildSearchUrl:
+    """Test build_search_url output."""
+
+    @pytest.mark.parametrize(
+        "job_title, location, page, network",
+        [
+            ("QA Engineer", "Lille", 1, None),
+            ("Développeur C++ & DevOps", "Île-de-France", 3, ["F", "S"]),
+            ("Data/ML engineer?", "", 2, None),
+            ("Tester", "103644278", 1, ["F"]),
+        ],
+    )
+    def test_matches_urlencode(self, job_title, location, page, network):
+        """Test that the hand-built query string matches urlencode."""
+        assert build_search_url(job_title, location, page, network) == reference_url(
+            job_title, location, page, network
+        )
+
+
+class TestBuildSearchUrlSimple:
+    """Test build_search_url_simple output."""
+
+    @pytest.mark.parametrize("value", ["QA Engineer", "Lille", "Développeur C++", "Paris/Lyon", "a~b_c.d-e"])
+    def test_quote_matches_urllib(self, value):
+        """Test that the plain-word fast path matches urllib.parse.quote."""
+        url = build_search_url_simple(value, value)
+        expected = urllib.parse.quote(value)
+        assert url == f"{SEARCH_URL}?keywords={expected}&origin=GLOBAL_SEARCH_HEADER&location={expected}"
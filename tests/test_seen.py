@@ -0,0 +1,60 @@
+"""Tests for the persistent seen-profile store."""
+
+from src.scraper.seen import BloomFilter, SeenStore, url_hash
+
+
+class TestSeenStore:
+    """Test SeenStore functionality."""
+
+    def test_url_hash_is_stable(self):
+        """Test that the hash is deterministic and fits a signed 64-bit column."""
+        url = "https://www.linkedin.com/in/johndoe"
+        assert url_hash(url) == url_hash(url)
+        assert url_hash(url) != url_hash(url + "2")
+        assert -(2 ** 63) <= url_hash(url) < 2 ** 63
+
+    def test_hashes_persist_across_sessions(self, tmp_path):
+        """Test that hashes written in one session are loaded by the next."""
+        filepath = tmp_path / "seen.sqlite3"
+        key = url_hash("https://www.linkedin.com/in/johndoe")
+
+        with SeenStore(filepath) as store:
+            store.add(key)
+            store.add(key)
+
+        with SeenStore(filepath) as store:
+            assert key in store
+            assert len(store) == 1
+
+    def test_unseen_hash_not_contained(self, tmp_path):
+        """Test that hashes never added are reported as unseen."""
+        with SeenStore(tmp_path / "seen.sqlite3") as store:
+            for i in range(1000):
+                store.add(url_hash(f"https://www.linkedin.com/in/user{i}"))
+
+            assert url_hash("https://www.linkedin.com/in/user1") in store
+            assert not any(
+                url_hash(f"https://www.linkedin.com/in/other{i}") in store for i in range(1000)
+            )
+
+
+class TestBloomFilter:
+    """Test BloomFilter functionality."""
+
+    def test_no_false_negatives(self):
+        """Test that every added key is reported as present."""
+        bloom = BloomFilter(1000)
+        keys = [url_hash(f"https://www.linkedin.com/in/user{i}") for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+
+        assert all(key in bloom for key in keys)
+
+    def test_false_positive_rate(self):
+        """Test that the false positive rate stays near the target at capacity."""
+        bloom = BloomFilter(1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(url_hash(f"https://www.linkedin.com/in/user{i}"))
+
+        hits = sum(url_hash(f"https://www.linkedin.com/in/other{i}") in bloom for i in range(10000))
+        assert hits < 300